@@ -1,7 +1,11 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import get_settings
+from shared.api.dart_client import get_dart_client, close_dart_client
+from shared.cache import close_storage
 from features.indicators.router import router as indicators_router
 from features.disclosures.router import router as disclosures_router
 from features.financial_statements.router import router as statements_router
@@ -10,10 +14,21 @@ from features.backtest.router import router as backtest_router
 
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """DartClient 수명 관리 (서버 이벤트 루프에서 생성, 종료 시 커넥션/저장소 정리)"""
+    app.state.dart = get_dart_client()
+    yield
+    await close_dart_client()
+    close_storage()
+
+
 app = FastAPI(
     title="My Little Buffett API",
     description="5대 투자 지표 분석 API",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS 설정
@@ -54,4 +69,5 @@ async def cache_stats():
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("app.main:app", host=settings.host, port=settings.port, reload=settings.debug)
+    # Dockerfile CMD와 같은 이벤트 루프 (uvloop) 사용
+    uvicorn.run("app.main:app", host=settings.host, port=settings.port, reload=settings.debug, loop="uvloop")
@@ -7,7 +7,7 @@ from fastapi import APIRouter, Query
 from typing import Optional
 from datetime import datetime, timedelta
 from shared.api.stock_price_client import stock_price_client
-from shared.cache import get_buffett_analysis
+from shared.cache import get_buffett_analysis_count, get_buffett_analysis_summary
 from shared.schemas import BaseResponse
 
 router = APIRouter(tags=["backtest"])
@@ -30,23 +30,21 @@ async def validate_strategy(
     4. 평균 수익률, 승률 등 통계 반환
     """
     # 1. DB에서 해당 연도 분석 결과 조회
-    all_results = get_buffett_analysis(year, fs_div)
-
-    if not all_results:
+    if get_buffett_analysis_count(year, fs_div) == 0:
         return BaseResponse(
             success=False,
             message=f"{year}년 {fs_div} 데이터가 없습니다. 먼저 스크리너를 실행해주세요.",
             data={}
         )
 
-    # 필터 통과한 종목만 선택 (signal != "데이터없음")
-    filtered = [r for r in all_results if r.get("signal") != "데이터없음" and r.get("filter_passed")]
-
-    # 점수순 정렬
-    filtered.sort(key=lambda x: x.get("total_score", 0), reverse=True)
-
-    # 상위 top_n개 선택
-    top_stocks = filtered[:top_n]
+    # 필터 통과 종목 중 점수 상위 top_n개만 필요한 컬럼으로 조회
+    top_stocks = get_buffett_analysis_summary(
+        year,
+        fs_div,
+        top_k=top_n,
+        columns=("corp_name", "stock_code", "total_score", "signal"),
+        passed_only=True,
+    )
 
     if not top_stocks:
         return BaseResponse(
@@ -63,7 +61,10 @@ async def validate_strategy(
     sell_year = buy_year + holding_years
     sell_date = datetime.now().strftime("%Y-%m-%d") if sell_year > datetime.now().year else f"{sell_year}-04-01"
 
-    # 3. 각 종목별 수익률 계산
+    # 3. 각 종목별 수익률 계산 (KOSPI 포함 일괄 조회)
+    stock_codes = [s.get("stock_code") for s in top_stocks if s.get("stock_code") and s.get("stock_code") != "N/A"]
+    return_rates = stock_price_client.get_return_rates(stock_codes + ["KS11"], buy_date, sell_date)
+
     results = []
     total_return = 0
     win_count = 0
@@ -79,7 +80,7 @@ async def validate_strategy(
             continue
 
         # 주가 수익률 조회
-        return_data = stock_price_client.get_return_rate(stock_code, buy_date, sell_date)
+        return_data = return_rates.get(stock_code)
 
         if return_data:
             return_rate = return_data["return_rate"]
@@ -114,7 +115,7 @@ async def validate_strategy(
     win_rate = (win_count / valid_count * 100) if valid_count > 0 else 0
 
     # KOSPI 수익률 (비교 기준) - 코스피 지수는 종목코드 "KS11"
-    kospi_return = stock_price_client.get_return_rate("KS11", buy_date, sell_date)
+    kospi_return = return_rates.get("KS11")
     kospi_rate = kospi_return["return_rate"] if kospi_return else 0
 
     return BaseResponse(
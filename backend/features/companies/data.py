@@ -3946,6 +3946,12 @@ COMPANIES = [
     ("00109693", "DL", "000210", "미분류"),
 ]
 
+# 고유번호 → 기업 튜플 (import 시 한 번 생성, 중복 고유번호는 목록의 첫 항목 사용)
+_COMPANY_BY_CODE = {}
+for _company in COMPANIES:
+    _COMPANY_BY_CODE.setdefault(_company[0], _company)
+del _company
+
 
 
 def search_companies(query: str, limit: int = 10) -> list[dict]:
@@ -3967,10 +3973,11 @@ def search_companies(query: str, limit: int = 10) -> list[dict]:
 
 def get_company_by_code(corp_code: str) -> dict | None:
     """고유번호로 기업 조회"""
-    for code, name, stock, sector in COMPANIES:
-        if code == corp_code:
-            return {"corp_code": code, "corp_name": name, "stock_code": stock, "sector": sector}
-    return None
+    company = _COMPANY_BY_CODE.get(corp_code)
+    if company is None:
+        return None
+    code, name, stock, sector = company
+    return {"corp_code": code, "corp_name": name, "stock_code": stock, "sector": sector}
 
 
 def get_all_companies() -> list[dict]:
@@ -1,7 +1,7 @@
 """재무제표 API 라우터"""
 
-from fastapi import APIRouter, HTTPException, Query
-from shared.api.dart_client import dart_client
+from fastapi import APIRouter, Depends, HTTPException, Query
+from shared.api.dart_client import DartClient, get_dart
 from shared.schemas.common import BaseResponse
 
 router = APIRouter()
@@ -13,6 +13,7 @@ async def get_financial_statements(
     bsns_year: str = Query(..., description="사업연도 (예: 2023)"),
     reprt_code: str = Query("11011", description="보고서 코드 (11011: 사업보고서)"),
     fs_div: str = Query("OFS", description="재무제표 구분 (OFS: 개별, CFS: 연결)"),
+    dart: DartClient = Depends(get_dart),
 ):
     """
     단일회사 전체 재무제표 조회
@@ -24,7 +25,7 @@ async def get_financial_statements(
     - 11014: 3분기보고서
     """
     try:
-        data = await dart_client.get_financial_statements(
+        data = await dart.get_financial_statements(
             corp_code=corp_code,
             bsns_year=bsns_year,
             reprt_code=reprt_code,
@@ -51,10 +52,11 @@ async def get_balance_sheet(
     bsns_year: str = Query(..., description="사업연도"),
     reprt_code: str = Query("11011", description="보고서 코드"),
     fs_div: str = Query("OFS", description="재무제표 구분"),
+    dart: DartClient = Depends(get_dart),
 ):
     """재무상태표(BS) 조회"""
     try:
-        data = await dart_client.get_financial_statements(
+        data = await dart.get_financial_statements(
             corp_code=corp_code,
             bsns_year=bsns_year,
             reprt_code=reprt_code,
@@ -78,10 +80,11 @@ async def get_income_statement(
     bsns_year: str = Query(..., description="사업연도"),
     reprt_code: str = Query("11011", description="보고서 코드"),
     fs_div: str = Query("OFS", description="재무제표 구분"),
+    dart: DartClient = Depends(get_dart),
 ):
     """손익계산서(IS) 조회"""
     try:
-        data = await dart_client.get_financial_statements(
+        data = await dart.get_financial_statements(
             corp_code=corp_code,
             bsns_year=bsns_year,
             reprt_code=reprt_code,
@@ -105,10 +108,11 @@ async def get_cash_flow(
     bsns_year: str = Query(..., description="사업연도"),
     reprt_code: str = Query("11011", description="보고서 코드"),
     fs_div: str = Query("OFS", description="재무제표 구분"),
+    dart: DartClient = Depends(get_dart),
 ):
     """현금흐름표(CF) 조회"""
     try:
-        data = await dart_client.get_financial_statements(
+        data = await dart.get_financial_statements(
             corp_code=corp_code,
             bsns_year=bsns_year,
             reprt_code=reprt_code,
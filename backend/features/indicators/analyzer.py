@@ -14,8 +14,9 @@
 """
 
 from datetime import datetime
-from dataclasses import dataclass
-from shared.api.dart_client import dart_client
+from dataclasses import dataclass, fields
+from shared.api.dart_client import get_dart_client
+from shared.cache import get_stored_metrics, store_metrics
 
 
 @dataclass
@@ -76,6 +77,16 @@ class FinancialMetrics:
         return (self.retained_earnings / self.capital_stock * 100) if self.capital_stock > 0 else 0
 
 
+# 지표 뷰로 저장하는 기간 (당기, 전기, 전전기) 및 필드
+METRIC_TERMS = ("thstrm", "frmtrm", "bfefrmtrm")
+METRIC_FIELDS = {f.name for f in fields(FinancialMetrics)}
+
+# 지표 추출 규칙 버전 (extract_metrics의 계정 매칭 규칙을 바꾸면 올려서 저장된 지표 뷰를 무효화)
+METRICS_VERSION = 1
+# 지표 뷰 파일에 버전을 기록하는 (term, metric) 행
+METRICS_META_TERM = "_meta"
+
+
 def parse_amount(value: str | None) -> float:
     """금액 문자열을 숫자로 변환"""
     if not value or value == "":
@@ -209,10 +220,17 @@ def extract_metrics(statements: list, term: str = "thstrm") -> FinancialMetrics:
 def extract_metrics_with_fallback(statements: list) -> FinancialMetrics:
     """3개년 데이터에서 가장 최근 유효한 값으로 메트릭 추출"""
     # 당기 → 전기 → 전전기 순으로 시도
-    current = extract_metrics(statements, "thstrm")
-    previous = extract_metrics(statements, "frmtrm")
-    before_prev = extract_metrics(statements, "bfefrmtrm")
+    return apply_metrics_fallback(
+        extract_metrics(statements, "thstrm"),
+        extract_metrics(statements, "frmtrm"),
+        extract_metrics(statements, "bfefrmtrm"),
+    )
 
+
+def apply_metrics_fallback(
+    current: FinancialMetrics, previous: FinancialMetrics, before_prev: FinancialMetrics
+) -> FinancialMetrics:
+    """당기 값이 0인 항목을 전기/전전기 값으로 채움 (current를 수정해서 반환)"""
     # 순이익이 0이면 이전 연도에서 가져오기
     if current.net_income == 0 and previous.net_income != 0:
         current.net_income = previous.net_income
@@ -240,6 +258,16 @@ def extract_metrics_with_fallback(statements: list) -> FinancialMetrics:
     return current
 
 
+def load_metric_terms(params: dict) -> dict[str, FinancialMetrics] | None:
+    """저장된 3개년 지표 뷰 조회 (없거나 추출 규칙 버전/필드 구성이 다르면 None)"""
+    stored = get_stored_metrics("fnlttSinglAcntAll.json", params)
+    if not stored or stored.get(METRICS_META_TERM, {}).get("version") != METRICS_VERSION:
+        return None
+    if any(set(stored.get(term, ())) != METRIC_FIELDS for term in METRIC_TERMS):
+        return None
+    return {term: FinancialMetrics(**stored[term]) for term in METRIC_TERMS}
+
+
 @dataclass
 class Indicator:
     """개별 지표"""
@@ -283,7 +311,7 @@ class BuffettAnalyzer:
     async def analyze(self, corp_code: str, corp_name: str, year: str, fs_div: str = "CFS") -> AnalysisResult | None:
         """종합 분석 수행 (데이터 없으면 최대 6년 전까지 fallback, CFS→OFS fallback, 사업보고서→반기보고서 fallback)"""
 
-        statements = None
+        terms = None  # {term: FinancialMetrics}
         actual_year = year
         actual_fs_div = fs_div
         actual_report = "11011"  # 사업보고서
@@ -302,9 +330,23 @@ class BuffettAnalyzer:
             for year_offset in range(6):  # 0~5년 전 (6년치)
                 for reprt_code in report_codes:
                     try_year = str(int(year) - year_offset)
-                    data = await dart_client.get_financial_statements(
-                        corp_code=corp_code, bsns_year=try_year, reprt_code=reprt_code, fs_div=try_fs_div
-                    )
+                    params = {
+                        "corp_code": corp_code,
+                        "bsns_year": try_year,
+                        "reprt_code": reprt_code,
+                        "fs_div": try_fs_div,
+                    }
+
+                    # 이미 추출해 둔 지표가 있으면 재무제표 파싱 생략
+                    terms = load_metric_terms(params)
+                    if terms:
+                        tried_combinations.append(f"{try_fs_div}/{try_year}/{reprt_code}=metrics")
+                        actual_year = try_year
+                        actual_fs_div = try_fs_div
+                        actual_report = reprt_code
+                        break
+
+                    data = await get_dart_client().get_financial_statements(**params)
 
                     status = data.get("status", "unknown")
                     tried_combinations.append(f"{try_fs_div}/{try_year}/{reprt_code}={status}")
@@ -314,17 +356,24 @@ class BuffettAnalyzer:
                         print(f"[ANALYZE] {corp_name} {try_fs_div}/{try_year}/{reprt_code}: Network error - {data.get('message', '')[:80]}")
 
                     if status == "000" and data.get("list"):
-                        statements = data.get("list", [])
+                        terms = {term: extract_metrics(data["list"], term) for term in METRIC_TERMS}
+                        store_metrics(
+                            "fnlttSinglAcntAll.json", params,
+                            {
+                                METRICS_META_TERM: {"version": METRICS_VERSION},
+                                **{term: m.__dict__ for term, m in terms.items()},
+                            },
+                        )
                         actual_year = try_year
                         actual_fs_div = try_fs_div
                         actual_report = reprt_code
                         break
-                if statements:
+                if terms:
                     break
-            if statements:
+            if terms:
                 break
 
-        if not statements:
+        if not terms:
             # 간단한 로그 (상세는 위에서 이미 출력됨)
             print(f"[ANALYZE] {corp_name}: No data (tried {len(tried_combinations)} combinations)")
             return None
@@ -346,9 +395,9 @@ class BuffettAnalyzer:
             data_source += f" ({', '.join(notes)})"
 
         # 3개년 지표 추출 (당기 데이터 없으면 전기/전전기에서 fallback)
-        current = extract_metrics_with_fallback(statements)
-        previous = extract_metrics(statements, "frmtrm")
-        before_prev = extract_metrics(statements, "bfefrmtrm")
+        previous = terms["frmtrm"]
+        before_prev = terms["bfefrmtrm"]
+        current = apply_metrics_fallback(terms["thstrm"], previous, before_prev)
 
         # ========================================
         # 1단계: 필터링 (부적격 기업 제외)
@@ -7,7 +7,7 @@ API 호출과 분석이 완전히 분리됨:
 
 import asyncio
 from datetime import datetime
-from fastapi import APIRouter, HTTPException, Query, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
 from .service import indicator_service
 from .trend_service import trend_service, stock_screener
 from .analyzer import financial_analyzer
@@ -21,7 +21,7 @@ from shared.cache import (
     clear_buffett_analysis,
 )
 from shared.storage.csv_storage import csv_storage
-from shared.api.dart_client import dart_client
+from shared.api.dart_client import DartClient, get_dart
 from features.companies.data import COMPANIES
 
 router = APIRouter()
@@ -326,6 +326,9 @@ async def refresh_screener(
     companies_to_analyze = []
     companies_skipped = []
 
+    # 파일 존재 여부는 디렉토리 목록 한 번으로 확인
+    csv_storage.preload_existing()
+
     for corp_code, corp_name, stock_code, sector in all_companies:
         # CSV 파일 존재 확인
         params = {
@@ -429,7 +432,8 @@ async def refresh_screener(
     for i in range(0, total, batch_size):
         batch = companies_to_analyze[i:i+batch_size]
         tasks = [analyze_and_save(code, name, stock, sector) for code, name, stock, sector in batch]
-        batch_results = await asyncio.gather(*tasks)
+        with csv_storage.bulk_scan():
+            batch_results = await asyncio.gather(*tasks)
 
         for item in batch_results:
             if "saved" in item:
@@ -681,15 +685,15 @@ async def debug_analysis(
     corp_code: str,
     bsns_year: str = Query(..., description="사업연도"),
     fs_div: str = Query("CFS", description="재무제표 구분"),
+    dart: DartClient = Depends(get_dart),
 ):
     """
     디버깅용: DART API 원본 응답과 파싱 결과 확인
     """
-    from shared.api.dart_client import dart_client
     from .analyzer import extract_metrics, extract_metrics_with_fallback
 
     # DART API 호출
-    data = await dart_client.get_financial_statements(
+    data = await dart.get_financial_statements(
         corp_code=corp_code, bsns_year=bsns_year, reprt_code="11011", fs_div=fs_div
     )
 
@@ -793,7 +797,10 @@ async def debug_csv_status(
             "fs_div": fs_div
         }
 
-        filepath = csv_storage._make_filepath("fnlttSinglAcntAll.json", params)
+        # zstd 압축 CSV 우선, 없으면 압축 전 형식(.csv)
+        filepath = csv_storage._make_filepath("fnlttSinglAcntAll.json", params).with_suffix(".csv.zst")
+        if not filepath.exists():
+            filepath = filepath.with_suffix("")
         exists = filepath.exists()
         size = os.path.getsize(filepath) if exists else 0
 
@@ -806,7 +813,7 @@ async def debug_csv_status(
         })
 
     csv_dir = csv_storage.csv_dir
-    csv_files = list(csv_dir.glob("*.csv"))
+    csv_files = list(csv_dir.glob("*.csv")) + list(csv_dir.glob("*.csv.zst"))
 
     return BaseResponse(
         success=True,
@@ -826,6 +833,7 @@ async def fetch_api_data(
     limit: int = Query(100, description="조회 개수", ge=1, le=4000),
     batch_size: int = Query(100, description="배치 크기 (기본 100, 속도 우선)", ge=1, le=500),
     max_concurrent: int = Query(100, description="최대 동시 요청 수 (기본 100, 속도 우선)", ge=1, le=500),
+    dart: DartClient = Depends(get_dart),
 ):
     """
     1단계: DART API 호출해서 CSV 저장만 (분석 안함)
@@ -845,6 +853,7 @@ async def fetch_api_data(
     # 세마포어는 dart_client.py에서 고정값 100으로 설정됨 (속도 최우선)
 
     companies_to_fetch = COMPANIES[:limit] if limit < len(COMPANIES) else COMPANIES
+    csv_storage.preload_existing()
     fetched_count = 0
     skipped_count = 0
     failed_corps = []
@@ -867,7 +876,7 @@ async def fetch_api_data(
 
         # API 호출 (dart_client가 자동으로 CSV 저장)
         try:
-            data = await dart_client.get_financial_statements(
+            data = await dart.get_financial_statements(
                 corp_code=corp_code,
                 bsns_year=year,
                 reprt_code="11011",
@@ -898,7 +907,8 @@ async def fetch_api_data(
     for batch_idx, i in enumerate(range(0, len(companies_to_fetch), batch_size), 1):
         batch = companies_to_fetch[i:i+batch_size]
         tasks = [fetch_company(code, name, stock, sector) for code, name, stock, sector in batch]
-        await asyncio.gather(*tasks)
+        with csv_storage.bulk_scan():
+            await asyncio.gather(*tasks)
 
         # 프로그레스 출력
         progress = (batch_idx / total_batches) * 100
@@ -936,7 +946,7 @@ async def analyze_from_csv(
 
     - /fetch로 미리 받아둔 CSV 읽어서 분석
     - API 호출 없이 로컬 CSV만 사용
-    - 결과는 buffett_analysis.csv에 저장
+    - 결과는 buffett_analysis_{year}_{fs_div}.csv에 저장
 
     파라미터:
     - batch_size: 한 배치당 처리할 기업 수 (기본 100)
@@ -945,6 +955,7 @@ async def analyze_from_csv(
     start_time = time.time()
 
     companies_to_analyze = COMPANIES[:limit] if limit < len(COMPANIES) else COMPANIES
+    csv_storage.preload_existing()
     results = []
     filtered_out = []
     no_csv_corps = []
@@ -1039,7 +1050,8 @@ async def analyze_from_csv(
     for i in range(0, len(companies_to_analyze), batch_size):
         batch = companies_to_analyze[i:i+batch_size]
         tasks = [analyze_from_csv_file(code, name, stock, sector) for code, name, stock, sector in batch]
-        batch_results = await asyncio.gather(*tasks)
+        with csv_storage.bulk_scan():
+            batch_results = await asyncio.gather(*tasks)
 
         for item in batch_results:
             if item.get("no_csv"):
@@ -1,7 +1,7 @@
 """5대 투자 지표 계산 서비스"""
 
 from datetime import datetime, timedelta
-from shared.api.dart_client import dart_client
+from shared.api.dart_client import DartClient, get_dart_client
 from shared.schemas.indicators import (
     SignalType,
     CashGenerationIndicator,
@@ -17,8 +17,9 @@ from shared.utils.parsers import parse_amount, parse_int
 class IndicatorService:
     """5대 지표 계산 서비스"""
 
-    def __init__(self):
-        self.client = dart_client
+    @property
+    def client(self) -> DartClient:
+        return get_dart_client()
 
     async def calculate_cash_generation(
         self, corp_code: str, bsns_year: str, fs_div: str = "OFS"
@@ -1,7 +1,7 @@
 """트렌드 분석 및 우량주 스캔 서비스"""
 
 from datetime import datetime
-from shared.api.dart_client import dart_client
+from shared.api.dart_client import DartClient, get_dart_client
 from shared.utils.parsers import parse_amount
 from features.indicators.service import indicator_service
 from shared.schemas.indicators import SignalType
@@ -30,8 +30,9 @@ MAJOR_COMPANIES = [
 class TrendService:
     """트렌드 분석 서비스"""
 
-    def __init__(self):
-        self.client = dart_client
+    @property
+    def client(self) -> DartClient:
+        return get_dart_client()
 
     async def get_multi_year_data(
         self, corp_code: str, years: list[str], fs_div: str = "OFS"
@@ -12,12 +12,13 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from features.companies.data import COMPANIES
-from shared.api.dart_client import dart_client
+from shared.api.dart_client import get_dart_client, close_dart_client
 from shared.cache import get_cache_stats
 
 
 async def preload_company(corp_code: str, corp_name: str, years: list[str]):
     """단일 기업 데이터 로딩"""
+    dart_client = get_dart_client()
     results = {"success": 0, "skip": 0, "fail": 0}
 
     for year in years:
@@ -88,6 +89,8 @@ async def main(years: list[str], limit: int | None = None):
     print()
     print("DB 통계:", get_cache_stats())
 
+    await close_dart_client()
+
 
 if __name__ == "__main__":
     import argparse
@@ -105,4 +108,11 @@ if __name__ == "__main__":
     args = parser.parse_args()
     years = [y.strip() for y in args.years.split(",")]
 
+    # uvloop 사용 가능하면 이벤트 루프 교체 (Windows 미지원)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(main(years, args.limit))
@@ -1,3 +1,3 @@
-from .dart_client import DartClient
+from .dart_client import DartClient, get_dart, get_dart_client, close_dart_client
 
-__all__ = ["DartClient"]
+__all__ = ["DartClient", "get_dart", "get_dart_client", "close_dart_client"]
@@ -6,7 +6,9 @@
 
 import httpx
 import asyncio
-from typing import Any
+import orjson
+from typing import Any, AsyncIterator
+from fastapi import Request
 from app.config import get_settings
 from shared.cache import get_stored, store_data
 
@@ -14,7 +16,52 @@ from shared.cache import get_stored, store_data
 API_CALL_DELAY = 0  # 딜레이 없음 (속도 최우선)
 
 # 동시 API 요청 제한 (DART API 서버 과부하 방지)
-API_SEMAPHORE = asyncio.Semaphore(100)  # 최대 100개 동시 요청 (속도 최우선)
+API_MAX_CONCURRENCY = 100  # 최대 100개 동시 요청 (속도 최우선)
+API_SEMAPHORE = asyncio.Semaphore(API_MAX_CONCURRENCY)
+
+# 커넥션 풀 - 동시 요청 수만큼 keep-alive 유지 (기본값 20개를 넘는 요청마다 TCP/TLS 핸드셰이크 방지)
+API_LIMITS = httpx.Limits(
+    max_connections=API_MAX_CONCURRENCY,
+    max_keepalive_connections=API_MAX_CONCURRENCY,
+    keepalive_expiry=30.0,
+)
+
+# 요청 타임아웃 - 응답 없는 연결이 세마포어 슬롯을 영구 점유하지 않도록 제한
+API_TIMEOUT = httpx.Timeout(connect=5.0, read=30.0, write=10.0, pool=5.0)
+
+# 재시도 횟수 및 백오프 기준 (0.2초 → 0.4초 → ...)
+API_MAX_RETRIES = 3
+API_RETRY_BACKOFF = 0.2
+
+# 일시적 오류 응답(020/800/900) 캐시 유효 시간 (초)
+NEGATIVE_CACHE_TTL = 3600
+
+# 클라이언트에서 사용하는 DART 엔드포인트 목록 (URL 사전 생성용)
+DART_ENDPOINTS = (
+    "fnlttSinglAcntAll.json",
+    "piicDecsn.json",
+    "cvbdIsDecsn.json",
+    "tsstkAqDecsn.json",
+    "lwstLg.json",
+    "elestock.json",
+    "hyslrSttus.json",
+    "otrCprInvstmntSttus.json",
+    "pssrpCptalUseDtls.json",
+    "company.json",
+)
+
+
+def _canon(params: dict) -> dict:
+    """캐시 키 정규화 (키 정렬 + 문자열 변환/공백 제거)
+
+    " 2023" 과 2023 처럼 의미가 같은 파라미터가 서로 다른 캐시 항목이 되지 않도록 한다.
+    """
+    return {k: str(v).strip() for k, v in sorted(params.items())}
+
+
+def _is_retryable_status(status_code: int) -> bool:
+    """재시도할 HTTP 상태 (429 Too Many Requests, 5xx 서버 오류)"""
+    return status_code == 429 or status_code >= 500
 
 
 class DartClient:
@@ -24,6 +71,20 @@ class DartClient:
         self.settings = get_settings()
         self.base_url = self.settings.dart_base_url
         self.api_key = self.settings.dart_api_key
+        self._urls = {endpoint: f"{self.base_url}/{endpoint}" for endpoint in DART_ENDPOINTS}
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """공유 HTTP 클라이언트 (커넥션 재사용, 최초 요청 시 생성)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=API_TIMEOUT, limits=API_LIMITS)
+        return self._client
+
+    async def aclose(self):
+        """공유 HTTP 클라이언트 종료"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     def _get_params(self, **kwargs) -> dict:
         params = {"crtfc_key": self.api_key}
@@ -32,6 +93,8 @@ class DartClient:
 
     async def _request(self, endpoint: str, **params) -> dict[str, Any]:
         """DB 우선 조회, 없으면 API 호출 후 저장"""
+        params = _canon(params)
+
         # 1. DB에서 조회
         stored = get_stored(endpoint, params)
         if stored:
@@ -40,61 +103,67 @@ class DartClient:
 
         # 2. 세마포어로 동시 API 요청 제한
         async with API_SEMAPHORE:
-            url = f"{self.base_url}/{endpoint}"
+            # 딜레이가 0이면 sleep(0) 으로 이벤트 루프에 양보하지 않고 바로 진행
+            if API_CALL_DELAY:
+                await asyncio.sleep(API_CALL_DELAY)
+
+            url = self._urls.get(endpoint) or f"{self.base_url}/{endpoint}"
             request_params = self._get_params(**params)
 
             print(f"[DART API CALL] {endpoint} - corp_code={params.get('corp_code', 'unknown')} year={params.get('bsns_year', 'unknown')}")
 
-            # 재시도 없음 (1번만 시도)
-            max_retries = 1
+            # 타임아웃 / 429 / 5xx 만 지수 백오프로 재시도 (최대 3회)
+            max_retries = API_MAX_RETRIES
             data = None  # 초기화: 모든 예외 경로에서 data 정의 보장
             last_error = None
+            attempts = 0  # 실제 시도 횟수 (재시도 불가 오류면 도중에 중단)
 
             for attempt in range(max_retries):
+                attempts = attempt + 1
                 try:
-                    async with httpx.AsyncClient() as client:
-                        response = await client.get(url, params=request_params, timeout=None)  # 타임아웃 없음
-                        response.raise_for_status()
-                        data = response.json()
-                        break  # 성공 시 루프 탈출
-                except httpx.TimeoutException as e:
+                    response = await self._get_client().get(url, params=request_params)
+                    response.raise_for_status()
+                    data = orjson.loads(response.content)  # bytes 그대로 파싱 (str 디코딩 생략)
+                    break  # 성공 시 루프 탈출
+                except (httpx.TimeoutException, httpx.RemoteProtocolError) as e:
+                    # 타임아웃 / Server disconnected: 재시도
                     last_error = e
-                    if attempt < max_retries - 1:
-                        continue  # 즉시 재시도
                 except httpx.HTTPStatusError as e:
                     last_error = e
-                    # 429 Too Many Requests: 재시도
-                    if e.response.status_code == 429 and attempt < max_retries - 1:
-                        continue  # 즉시 재시도
-                    break
-                except httpx.RemoteProtocolError as e:
-                    # Server disconnected: 재시도
-                    last_error = e
-                    if attempt < max_retries - 1:
-                        continue  # 즉시 재시도
-                    break
+                    # 429 Too Many Requests, 5xx 서버 오류만 재시도
+                    if not _is_retryable_status(e.response.status_code):
+                        break
                 except Exception as e:
+                    # 그 외 에러는 재시도해도 같은 결과이므로 즉시 중단
                     last_error = e
-                    # 일반 네트워크 에러도 재시도
-                    if "Server disconnected" in str(e) and attempt < max_retries - 1:
-                        continue  # 즉시 재시도
                     break
 
-            # 재시도 모두 실패 시
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(API_RETRY_BACKOFF * 2 ** attempt)
+
+            # 재시도 모두 실패 또는 재시도 불가 오류
             if data is None:
-                print(f"[DART API ERROR] {endpoint} - {params}: {last_error}")
-                return {"status": "999", "message": f"Network error after {max_retries} retries: {str(last_error)}"}
+                print(f"[DART API ERROR] {endpoint} - {params} ({attempts} attempt(s)): {last_error}")
+                if isinstance(last_error, httpx.HTTPStatusError) and not _is_retryable_status(
+                    last_error.response.status_code
+                ):
+                    message = f"HTTP {last_error.response.status_code} error (not retried): {last_error}"
+                else:
+                    message = f"Network error after {attempts} attempt(s): {last_error}"
+                return {"status": "999", "message": message}
 
             # 3. API 응답 저장 (성공/실패 모두 캐시하여 반복 호출 방지)
             status = data.get("status", "")
             if status == "000":
                 # 성공: 영구 저장
                 store_data(endpoint, params, data)
-            elif status in ("013", "020", "800", "900"):
-                # 데이터 없음/조회 기간 오류 등: 캐시하여 재호출 방지
-                # 013: 조회된 데이터 없음
-                # 020: 유효하지 않은 값
+            elif status == "013":
+                # 013: 조회된 데이터 없음 - 영구 저장하여 재호출 방지
                 store_data(endpoint, params, data)
+            elif status in ("020", "800", "900"):
+                # 020: 유효하지 않은 값 / 800, 900: DART 점검·오류
+                # DART 복구 후에도 "데이터 없음"이 고착되지 않도록 TTL 동안만 캐시
+                store_data(endpoint, params, data, ttl_seconds=NEGATIVE_CACHE_TTL)
             else:
                 # API 제한 등 일시적 오류: 로그만 남기고 캐시 안함
                 print(f"[DART API] {endpoint} status={status}: {data.get('message', '')}")
@@ -124,6 +193,31 @@ class DartClient:
             fs_div=fs_div,
         )
 
+    async def bulk_financial_statements(
+        self, corp_codes: list[str], bsns_year: str, reprt_code: str = "11011", fs_div: str = "OFS"
+    ) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """
+        여러 회사의 재무제표를 동시에 조회 (완료되는 순서대로 반환)
+
+        동시 요청 수는 API_SEMAPHORE로 제한되며, 하나가 끝나는 즉시 다음 요청이 시작되어
+        배치 단위 gather처럼 가장 느린 요청을 기다리지 않는다.
+
+        Yields:
+            (corp_code, 응답) 튜플
+        """
+        async def fetch(corp_code: str) -> tuple[str, dict[str, Any]]:
+            data = await self.get_financial_statements(corp_code, bsns_year, reprt_code, fs_div)
+            return corp_code, data
+
+        tasks = [asyncio.create_task(fetch(corp_code)) for corp_code in corp_codes]
+        try:
+            for fut in asyncio.as_completed(tasks):
+                yield await fut
+        finally:
+            # 소비자가 중간에 중단한 경우 남은 요청 취소
+            for task in tasks:
+                task.cancel()
+
     # ========================
     # 주요사항보고
     # ========================
@@ -210,5 +304,24 @@ class DartClient:
         return await self._request("company.json", corp_name=corp_name)
 
 
-# 싱글톤 인스턴스
-dart_client = DartClient()
+# 공유 인스턴스 (import 시점이 아닌 최초 사용 시 생성)
+_dart_client: DartClient | None = None
+
+
+def get_dart_client() -> DartClient:
+    """프로세스 공유 DartClient 반환 (최초 호출 시 설정 로드 및 생성)"""
+    global _dart_client
+    if _dart_client is None:
+        _dart_client = DartClient()
+    return _dart_client
+
+
+async def close_dart_client():
+    """공유 DartClient의 HTTP 커넥션 정리"""
+    if _dart_client is not None:
+        await _dart_client.aclose()
+
+
+def get_dart(request: Request) -> DartClient:
+    """FastAPI 의존성: lifespan에서 등록한 DartClient (Depends(get_dart))"""
+    return request.app.state.dart
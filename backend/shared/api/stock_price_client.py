@@ -4,14 +4,27 @@
 """
 
 import FinanceDataReader as fdr
+import pandas as pd
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
-from shared.cache import get_stored, store_data
+from shared.cache import get_stored_many, store_data_many
+
+# 여러 종목 동시 조회 시 최대 스레드 수
+FETCH_WORKERS = 16
+
+# 주가 없음으로 확인된 (종목코드, 날짜) 메모리 캐시 최대 항목 수 (LRU)
+NEG_CACHE_SIZE = 4096
 
 
 class StockPriceClient:
     """주가 데이터 클라이언트 (DB 캐싱)"""
 
+    def __init__(self):
+        # 주가 없음 메모리 캐시 {(종목코드, 날짜): None} - DB 조회까지 생략
+        self._no_price = OrderedDict()
+
     def get_price_at_date(self, stock_code: str, target_date: str) -> Optional[float]:
         """
         특정 날짜의 주가(종가) 조회
@@ -23,41 +36,122 @@ class StockPriceClient:
         Returns:
             해당 날짜의 종가, 데이터 없으면 None
         """
-        # DB 캐시 확인
-        cache_key = f"stock_price_{stock_code}_{target_date}"
-        stored = get_stored("stock_price", {"stock_code": stock_code, "date": target_date})
-        if stored and "price" in stored:
-            return stored["price"]
+        return self.get_prices_at_dates(stock_code, [target_date]).get(target_date)
+
+    def get_prices_at_dates(self, stock_code: str, dates: list[str]) -> dict[str, Optional[float]]:
+        """
+        여러 날짜의 주가(종가) 일괄 조회
+
+        캐시에 없는 날짜들을 한 번의 DataReader 호출(최소~최대 날짜 ±5일)로 가져온 뒤
+        날짜별로 가장 가까운 거래일 종가를 골라 캐싱합니다.
+
+        Args:
+            stock_code: 종목코드 (6자리, 예: "005930")
+            dates: 날짜 목록 (YYYY-MM-DD)
+
+        Returns:
+            {날짜: 종가} (데이터 없는 날짜는 None)
+        """
+        prices = self.get_prices_bulk([(stock_code, target_date) for target_date in dates])
+        return {target_date: price for (_, target_date), price in prices.items()}
+
+    def get_prices_bulk(self, requests: list[tuple[str, str]]) -> dict[tuple[str, str], Optional[float]]:
+        """
+        여러 (종목코드, 날짜) 주가 일괄 조회
+
+        캐시에 없는 요청을 종목별로 묶어 스레드 풀에서 동시에 조회합니다
+        (종목당 DataReader 1회, 네트워크 대기 중 GIL 해제).
+
+        Args:
+            requests: [(종목코드, 날짜 YYYY-MM-DD), ...]
+
+        Returns:
+            {(종목코드, 날짜): 종가} (데이터 없는 요청은 None)
+        """
+        prices = {}
+        missing = {}
+
+        # 주가 없음 메모리 캐시 확인
+        pending = []
+        for key in dict.fromkeys(requests):
+            if key in self._no_price:
+                self._no_price.move_to_end(key)
+                prices[key] = None
+            else:
+                pending.append(key)
+
+        # DB 캐시 일괄 확인
+        stored_list = get_stored_many("stock_price", [
+            {"stock_code": stock_code, "date": target_date}
+            for stock_code, target_date in pending
+        ])
+        for key, stored in zip(pending, stored_list):
+            stock_code, target_date = key
+            if stored and "price" in stored:
+                prices[key] = stored["price"]
+                if stored["price"] is None:
+                    self._remember_no_price(stock_code, target_date)
+            else:
+                missing.setdefault(stock_code, []).append(target_date)
+
+        if not missing:
+            return prices
+
+        with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(missing))) as executor:
+            fetched = executor.map(lambda code: self._fetch_prices(code, missing[code]), missing)
+            fetched = dict(zip(missing, fetched))
 
+        to_store = []
+        for stock_code, dates in missing.items():
+            # 조회 실패 종목은 캐싱하지 않음 (다음에 재시도)
+            if fetched[stock_code] is None:
+                prices.update(((stock_code, target_date), None) for target_date in dates)
+                continue
+
+            for target_date, price in zip(dates, fetched[stock_code]):
+                prices[(stock_code, target_date)] = price
+                if price is None:
+                    self._remember_no_price(stock_code, target_date)
+                to_store.append(({"stock_code": stock_code, "date": target_date}, {"price": price}))
+
+        # 캐싱 (데이터 없음도 캐싱하여 반복 조회 방지)
+        store_data_many("stock_price", to_store)
+
+        return prices
+
+    def _fetch_prices(self, stock_code: str, dates: list[str]) -> Optional[list[Optional[float]]]:
+        """KRX에서 날짜 범위 주가를 한 번에 가져와 날짜별 가장 가까운 거래일 종가 반환 (실패 시 None)"""
         try:
-            # 해당 날짜 전후 5일 범위에서 데이터 조회 (주말/공휴일 대응)
-            target = datetime.strptime(target_date, "%Y-%m-%d")
-            start_date = (target - timedelta(days=5)).strftime("%Y-%m-%d")
-            end_date = (target + timedelta(days=5)).strftime("%Y-%m-%d")
+            # 전체 날짜 범위 전후 5일을 한 번에 조회 (주말/공휴일 대응)
+            targets = pd.to_datetime(dates, format="%Y-%m-%d")
+            start_date = (targets.min() - timedelta(days=5)).strftime("%Y-%m-%d")
+            end_date = (targets.max() + timedelta(days=5)).strftime("%Y-%m-%d")
 
             df = fdr.DataReader(stock_code, start_date, end_date)
 
             if df.empty:
-                # 데이터 없음도 캐싱 (반복 조회 방지)
-                store_data("stock_price", {"stock_code": stock_code, "date": target_date}, {"price": None})
-                return None
-
-            # 가장 가까운 날짜의 종가 선택
-            df.index = df.index.map(lambda x: x.strftime("%Y-%m-%d"))
-            if target_date in df.index:
-                price = float(df.loc[target_date]["Close"])
-            else:
-                # 가장 가까운 날짜 찾기
-                price = float(df.iloc[0]["Close"])
+                return [None] * len(dates)
 
-            # 캐싱
-            store_data("stock_price", {"stock_code": stock_code, "date": target_date}, {"price": price})
-            return price
+            # 날짜별 가장 가까운 거래일 위치 (±5일 밖이면 데이터 없음)
+            positions = df.index.get_indexer(targets, method="nearest")
+            gaps = abs(df.index[positions] - targets)
+            closes = df["Close"]
+            return [
+                float(closes.iloc[pos]) if gap <= timedelta(days=5) else None
+                for pos, gap in zip(positions, gaps)
+            ]
 
         except Exception as e:
-            print(f"[STOCK PRICE ERROR] {stock_code} at {target_date}: {e}")
+            print(f"[STOCK PRICE ERROR] {stock_code} at {dates}: {e}")
             return None
 
+    def _remember_no_price(self, stock_code: str, target_date: str):
+        """주가 없음 확인된 (종목코드, 날짜)를 메모리 캐시에 추가"""
+        self._no_price[(stock_code, target_date)] = None
+        self._no_price.move_to_end((stock_code, target_date))
+        if len(self._no_price) > NEG_CACHE_SIZE:
+            self._no_price.popitem(last=False)
+
     def get_return_rate(
         self,
         stock_code: str,
@@ -81,19 +175,58 @@ class StockPriceClient:
                 "end_date": 실제 종료일
             }
         """
+        return self.get_return_rates([stock_code], start_date, end_date).get(stock_code)
+
+    def get_return_rates(
+        self,
+        stock_codes: list[str],
+        start_date: str,
+        end_date: str = None
+    ) -> dict[str, Optional[dict]]:
+        """
+        여러 종목의 같은 기간 수익률 일괄 계산
+
+        캐시에 없는 종목들은 스레드 풀에서 동시에 조회합니다 (네트워크 대기 중 GIL 해제).
+
+        Returns:
+            {종목코드: get_return_rate 결과} (데이터 없는 종목은 None)
+        """
         if end_date is None:
             end_date = datetime.now().strftime("%Y-%m-%d")
 
-        # DB 캐시 확인
-        cache_key = f"return_rate_{stock_code}_{start_date}_{end_date}"
-        stored = get_stored("return_rate", {
-            "stock_code": stock_code,
-            "start_date": start_date,
-            "end_date": end_date
-        })
-        if stored and "return_rate" in stored:
-            return stored
+        results = {}
+        missing = []
+
+        # DB 캐시 일괄 확인
+        stock_codes = list(dict.fromkeys(stock_codes))
+        stored_list = get_stored_many("return_rate", [
+            {"stock_code": stock_code, "start_date": start_date, "end_date": end_date}
+            for stock_code in stock_codes
+        ])
+        for stock_code, stored in zip(stock_codes, stored_list):
+            if stored and "return_rate" in stored:
+                results[stock_code] = stored
+            else:
+                missing.append(stock_code)
+
+        if not missing:
+            return results
+
+        with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(missing))) as executor:
+            fetched = executor.map(lambda code: self._fetch_return_rate(code, start_date, end_date), missing)
+            results.update(zip(missing, fetched))
+
+        # 캐싱 (계산된 종목만)
+        store_data_many("return_rate", [
+            ({"stock_code": stock_code, "start_date": start_date, "end_date": end_date}, results[stock_code])
+            for stock_code in missing
+            if results[stock_code] is not None
+        ])
 
+        return results
+
+    def _fetch_return_rate(self, stock_code: str, start_date: str, end_date: str) -> Optional[dict]:
+        """KRX에서 기간 주가를 가져와 첫/마지막 거래일 종가로 수익률 계산"""
         try:
             # 주가 데이터 가져오기
             df = fdr.DataReader(stock_code, start_date, end_date)
@@ -108,7 +241,7 @@ class StockPriceClient:
             actual_start = df.index[0].strftime("%Y-%m-%d")
             actual_end = df.index[-1].strftime("%Y-%m-%d")
 
-            result = {
+            return {
                 "start_price": round(start_price, 2),
                 "end_price": round(end_price, 2),
                 "return_rate": round(return_rate, 2),
@@ -116,15 +249,6 @@ class StockPriceClient:
                 "end_date": actual_end
             }
 
-            # 캐싱
-            store_data("return_rate", {
-                "stock_code": stock_code,
-                "start_date": start_date,
-                "end_date": end_date
-            }, result)
-
-            return result
-
         except Exception as e:
             print(f"[RETURN RATE ERROR] {stock_code} ({start_date} ~ {end_date}): {e}")
             return None
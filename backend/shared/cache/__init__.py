@@ -15,9 +15,29 @@ def get_stored(endpoint: str, params: dict):
     return csv_storage.get_api_data(endpoint, params)
 
 
-def store_data(endpoint: str, params: dict, response: dict):
-    """API 응답 저장 (CSV Storage 어댑터)"""
-    csv_storage.store_api_data(endpoint, params, response)
+def get_stored_many(endpoint: str, params_list: list[dict]):
+    """API 응답 일괄 조회 (CSV Storage 어댑터, params_list 순서대로 반환)"""
+    return csv_storage.get_api_data_many(endpoint, params_list)
+
+
+def store_data(endpoint: str, params: dict, response: dict, ttl_seconds: int = None):
+    """API 응답 저장 (CSV Storage 어댑터, ttl_seconds 없으면 영구 저장)"""
+    csv_storage.store_api_data(endpoint, params, response, ttl_seconds=ttl_seconds)
+
+
+def store_data_many(endpoint: str, items: list[tuple[dict, dict]], ttl_seconds: int = None):
+    """API 응답 일괄 저장 (CSV Storage 어댑터, items: (params, response) 리스트)"""
+    csv_storage.store_api_data_many(endpoint, items, ttl_seconds=ttl_seconds)
+
+
+def get_stored_metrics(endpoint: str, params: dict):
+    """API 응답에서 추출한 지표 조회 (CSV Storage 어댑터)"""
+    return csv_storage.get_metrics(endpoint, params)
+
+
+def store_metrics(endpoint: str, params: dict, metrics: dict):
+    """API 응답에서 추출한 지표 저장 (CSV Storage 어댑터)"""
+    csv_storage.store_metrics(endpoint, params, metrics)
 
 
 # ==========================================
@@ -60,6 +80,17 @@ def get_buffett_analysis(year: str, fs_div: str):
     return csv_storage.get_analysis_results(year, fs_div)
 
 
+def get_buffett_analysis_summary(
+    year: str,
+    fs_div: str,
+    top_k: int = 50,
+    columns: tuple[str, ...] = ("corp_name", "total_score", "signal"),
+    passed_only: bool = False,
+):
+    """점수 상위 top_k개 요약 조회 (CSV Storage 어댑터)"""
+    return csv_storage.get_analysis_summary(year, fs_div, top_k, columns, passed_only)
+
+
 def get_buffett_analysis_count(year: str, fs_div: str) -> int:
     """분석 결과 개수 조회 (CSV Storage 어댑터)"""
     return csv_storage.get_buffett_analysis_count(year, fs_div)
@@ -75,6 +106,11 @@ def get_available_years():
     return csv_storage.get_available_years()
 
 
+def close_storage():
+    """남은 분석 결과 저장 후 파일 핸들 정리 (CSV Storage 어댑터)"""
+    csv_storage.close()
+
+
 # ==========================================
 # 하위 호환성 함수 (사용하지 않지만 import 에러 방지)
 # ==========================================
@@ -106,7 +142,11 @@ def set_cached(key: str, value: any, ttl: int = None):
 
 __all__ = [
     "get_stored",
+    "get_stored_many",
     "store_data",
+    "store_data_many",
+    "get_stored_metrics",
+    "store_metrics",
     "get_cache_stats",
     "get_stored_companies",
     "cleanup_expired",
@@ -116,5 +156,7 @@ __all__ = [
     "clear_buffett_analysis",
     "save_buffett_analysis",
     "get_buffett_analysis_count",
+    "get_buffett_analysis_summary",
     "get_available_years",
+    "close_storage",
 ]
@@ -3,12 +3,206 @@
 API 응답과 분석 결과를 CSV 파일로 저장합니다.
 """
 
-import json
-import hashlib
+import csv
+import io
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
 from typing import Any
-from datetime import datetime
-import pandas as pd
+from datetime import datetime, timedelta
+from functools import lru_cache
+import orjson
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import zstandard as zstd
+
+from .parquet_store import ParquetStore
+
+# API 응답 메모리 캐시 최대 항목 수 (LRU, 파싱된 재무제표 1건이 수백 KB라 작게 유지)
+MEM_CACHE_SIZE = 256
+
+# 대량 조회(bulk_scan) 중인지 - True면 읽은 응답을 메모리 캐시에 넣지 않음 (asyncio 태스크별로 분리)
+_bulk_scan: ContextVar[bool] = ContextVar("csv_storage_bulk_scan", default=False)
+
+# 동시에 열어 두는 분석 결과 파티션 CSV append 핸들 최대 수 (LRU)
+RESULT_WRITERS_MAX = 16
+
+# 분석 결과 파티션 append 핸들 쓰기 버퍼 크기 (flush 한 번의 행들이 write 시스템 콜 한 번으로 기록되도록)
+RESULT_WRITE_BUFFER = 1 << 20
+
+# preload_existing 스냅샷 유효 시간 (초) - 지나면 다른 프로세스가 만든 파일도 다시 stat으로 확인
+EXISTING_SNAPSHOT_TTL = 60.0
+
+# 일괄 저장 시 동시에 쓰는 최대 파일 수 (파일 I/O 대기 중 GIL 해제)
+STORE_WORKERS = 8
+
+# 파일명 고정 위치에 들어가는 파라미터 (그 외 파라미터는 파일명 끝에 덧붙임)
+FILENAME_PARAMS = frozenset(("corp_code", "bsns_year", "fs_div", "reprt_code", "corp_name"))
+
+# 분석 결과 CSV 기본 컬럼 순서 (지표 컬럼 {지표}_value/_score/_grade 는 처음 저장될 때 뒤에 추가)
+RESULT_BASE_COLUMNS = (
+    "corp_code", "corp_name", "stock_code", "sector", "bsns_year", "fs_div",
+    "total_score", "signal", "filter_passed", "filter_reasons", "data_source", "created_at",
+)
+_YEAR_IDX = RESULT_BASE_COLUMNS.index("bsns_year")
+_DIV_IDX = RESULT_BASE_COLUMNS.index("fs_div")
+
+# 분석 결과 기본 컬럼 타입 (코드/년도는 문자열 고정)
+RESULT_COLUMN_TYPES = {
+    "corp_code": pa.string(),
+    "corp_name": pa.string(),
+    "stock_code": pa.string(),
+    "sector": pa.string(),
+    "bsns_year": pa.string(),
+    "fs_div": pa.string(),
+    "total_score": pa.float64(),
+    "signal": pa.string(),
+    "filter_passed": pa.int64(),
+    "filter_reasons": pa.string(),
+    "data_source": pa.string(),
+    "created_at": pa.string(),
+}
+
+# 분석 결과 CSV 읽기 옵션 (지표 컬럼은 자동 추론, 빈 값은 null)
+RESULT_CONVERT_OPTIONS = pacsv.ConvertOptions(
+    column_types=RESULT_COLUMN_TYPES,
+    strings_can_be_null=True,
+)
+
+# 결과 CSV 행 수만 셀 때 읽는 컬럼
+RESULT_COUNT_OPTIONS = pacsv.ConvertOptions(
+    column_types={"corp_code": pa.string()},
+    include_columns=["corp_code"],
+)
+
+# 빈 filter_reasons 직렬화 결과 (orjson 호출 생략)
+_EMPTY_JSON = "[]"
+
+# API 응답 CSV 확장자 (영구 저장 / TTL 있는 일시 오류 응답은 file_exists에서 제외되도록 따로 저장)
+API_CSV_SUFFIX = ".csv.zst"
+API_TTL_CSV_SUFFIX = ".ttl.csv.zst"
+
+# API 응답 CSV/JSON 압축 레벨 (zstd, 낮을수록 빠름)
+ZSTD_LEVEL = 3
+
+
+@lru_cache(maxsize=65536)
+def _build_filename(
+    endpoint: str,
+    corp_code: str,
+    bsns_year: str,
+    fs_div: str,
+    reprt_code: str,
+    corp_name: str,
+    extra: tuple,
+) -> str:
+    """CSV 파일명 생성 (같은 파라미터 조합은 캐시된 문자열 재사용)
+
+    파일명 형식: {year}_{endpoint}_{corp_code}_{corp_name}_{fs_div}_{reprt_code}[_{기타 파라미터}].csv
+    """
+    # Endpoint에서 .json 제거
+    endpoint_name = endpoint.replace(".json", "")
+
+    # 파일명 생성 (회사명은 있으면 추가, 없으면 생략)
+    if corp_name:
+        stem = f"{bsns_year}_{endpoint_name}_{corp_code}_{corp_name}_{fs_div}_{reprt_code}"
+    else:
+        stem = f"{bsns_year}_{endpoint_name}_{corp_code}_{fs_div}_{reprt_code}"
+
+    # 기타 파라미터 (주가 종목/날짜, 공시 조회 기간 등)는 키 이름순으로 덧붙임
+    if extra:
+        stem += "_" + "_".join(str(value) for value in extra)
+
+    return f"{stem}.csv"
+
+
+# 마지막으로 만든 타임스탬프 (생성 시각(초), ISO 문자열) - 1초 안의 저장은 같은 문자열 재사용
+_ts_cache: tuple[float, str] = (0.0, "")
+
+
+def _now_iso() -> str:
+    """현재 시각 ISO 문자열 (초 단위, 1초 동안 캐시)"""
+    global _ts_cache
+    now = time.time()
+    cached_at, iso = _ts_cache
+    if now - cached_at >= 1.0:
+        iso = datetime.fromtimestamp(now).isoformat(timespec="seconds")
+        _ts_cache = (now, iso)
+    return iso
+
+
+def _result_schema(columns: list[str]) -> pa.Schema:
+    """분석 결과 Arrow 스키마 (배치마다 타입을 추론하지 않도록 컬럼 이름으로 고정)
+
+    지표 컬럼은 {지표}_grade 는 문자열, {지표}_value/_score 는 float64
+    """
+    return pa.schema([
+        (column, RESULT_COLUMN_TYPES.get(column)
+         or (pa.string() if column.endswith("_grade") else pa.float64()))
+        for column in columns
+    ])
+
+
+def _parse_metadata(line: str) -> dict[str, str]:
+    """CSV 첫 줄 주석 메타데이터 파싱 ("# status=000,message=...,fetched_at=...")"""
+    metadata = {}
+    for item in line[1:].strip().split(","):
+        name, sep, value = item.partition("=")
+        if sep:
+            metadata[name] = value
+    return metadata
+
+
+def _decode_filter_reasons(results: list[dict]) -> list[dict]:
+    """filter_reasons 컬럼을 JSON 문자열에서 list로 변환 (빈 값은 파싱 생략)"""
+    loads = orjson.loads
+    for result in results:
+        reasons = result.get("filter_reasons")
+        if isinstance(reasons, str) and reasons and reasons != _EMPTY_JSON:
+            try:
+                result["filter_reasons"] = loads(reasons)
+            except ValueError:
+                result["filter_reasons"] = []
+        else:
+            result["filter_reasons"] = []
+    return results
+
+
+class _ResultLayout:
+    """파티션 결과 CSV 컬럼 순서 (RESULT_BASE_COLUMNS + 지표 컬럼)와 지표별 (value, score, grade) 컬럼 위치"""
+
+    __slots__ = ("columns", "index", "indicator_slots")
+
+    def __init__(self, header: list[str] = ()):
+        self.columns: list[str] = list(RESULT_BASE_COLUMNS)
+        self.index: dict[str, int] = {col: i for i, col in enumerate(RESULT_BASE_COLUMNS)}
+        self.indicator_slots: dict[str, tuple[int, int, int]] = {}
+        # 기존 파일 header에만 있는 컬럼도 순서에 반영
+        for column in header:
+            self.add_column(column)
+
+    def add_column(self, column: str) -> int:
+        """컬럼 위치 조회 (없으면 맨 뒤에 추가)"""
+        idx = self.index.get(column)
+        if idx is None:
+            idx = len(self.columns)
+            self.columns.append(column)
+            self.index[column] = idx
+        return idx
+
+    def indicator_slot(self, key: str) -> tuple[int, int, int]:
+        """지표 컬럼 (value, score, grade) 위치 (처음 보는 지표면 컬럼 추가)"""
+        slot = self.indicator_slots.get(key)
+        if slot is None:
+            slot = tuple(self.add_column(f"{key}_{suffix}") for suffix in ("value", "score", "grade"))
+            self.indicator_slots[key] = slot
+        return slot
 
 
 class CSVStorage:
@@ -20,14 +214,41 @@ class CSVStorage:
 
         self.csv_dir = base_path / "csv"
         self.results_dir = base_path / "results"
+        self.metrics_dir = base_path / "metrics"
 
         # 디렉토리 생성
         self.csv_dir.mkdir(parents=True, exist_ok=True)
         self.results_dir.mkdir(parents=True, exist_ok=True)
+        self.metrics_dir.mkdir(parents=True, exist_ok=True)
 
         # 결과 버퍼 (100개씩 모아서 쓰기)
         self._results_buffer = []
 
+        # 파티션별 결과 컬럼 순서 {(년도, 구분): _ResultLayout} (파티션에 처음 저장할 때 기존 header로 생성)
+        self._result_layouts: dict[tuple[str, str], _ResultLayout] = {}
+
+        # 파티션별 결과 CSV append 핸들 {(년도, 구분): (파일, writer, 컬럼 수)} (첫 flush 때 열어서 계속 사용)
+        self._results_writers: OrderedDict[tuple[str, str], tuple[Any, Any, int]] = OrderedDict()
+
+        # 분석 결과 년도 집합 (첫 조회 시 채우고 저장/삭제 시 갱신, None이면 미계산)
+        self._years: set[str] | None = None
+
+        # API 응답 메모리 캐시 (파일명 → (응답, 만료시각)), 같은 프로세스 내 반복 조회 시 파일 읽기 생략
+        self._mem_cache: OrderedDict[str, tuple[dict, datetime | None]] = OrderedDict()
+        self._mem_lock = threading.Lock()
+
+        # 존재가 확인된 CSV 파일명 (file_exists 반복 호출 시 stat 생략)
+        self._existing: set[str] = set()
+        # preload_existing 스냅샷 만료 시각 (time.monotonic 기준, 그 전까지는 집합에 없는 파일은 없는 것으로 판단)
+        self._existing_complete_until = 0.0
+
+        # 분석 결과 Parquet 미러 (파티션/컬럼 단위 조회용, 원본은 CSV)
+        self._parquet = ParquetStore(self.results_dir / "buffett_analysis")
+        # CSV와 맞지 않아 이 프로세스에서는 CSV로만 조회하는 파티션 {(년도, 구분)}
+        self._parquet_stale: set[tuple[str, str]] = set()
+        self._split_legacy_results()
+        self._backfill_parquet()
+
     # ==========================================
     # API 응답 저장/조회
     # ==========================================
@@ -38,112 +259,350 @@ class CSVStorage:
         Returns:
             dict: 저장된 API 응답 (없으면 None)
         """
-        filepath = self._make_filepath(endpoint, params)
+        return self.get_api_data_many(endpoint, [params])[0]
 
-        if not filepath.exists():
+    def get_api_data_many(self, endpoint: str, params_list: list[dict]) -> list[dict | None]:
+        """여러 API 응답 일괄 조회 (메모리 캐시는 한 번의 잠금으로 확인)
+
+        Returns:
+            list: params_list 순서대로 저장된 API 응답 (없으면 None)
+        """
+        filepaths = [self._make_filepath(endpoint, params) for params in params_list]
+        results = [None] * len(filepaths)
+        misses = []
+
+        # 메모리 캐시 확인
+        now = datetime.now()
+        with self._mem_lock:
+            for i, filepath in enumerate(filepaths):
+                key = filepath.name
+                entry = self._mem_cache.get(key)
+                if entry is None:
+                    misses.append(i)
+                    continue
+
+                cached, expires_at = entry
+                if expires_at is None or now <= expires_at:
+                    self._mem_cache.move_to_end(key)
+                    results[i] = cached
+                else:
+                    del self._mem_cache[key]
+                    misses.append(i)
+
+        # 메모리에 없는 항목만 파일에서 읽기
+        for i in misses:
+            results[i] = self._read_api_file(filepaths[i])
+
+        return results
+
+    def _read_api_file(self, filepath: Path) -> dict | None:
+        """저장된 API 응답 파일 읽기 (읽은 응답은 메모리 캐시에 추가)"""
+        key = filepath.name
+
+        # zstd 압축 CSV (영구 → TTL) 우선, 없으면 압축 전 형식(.csv) 파일
+        text = None
+        try:
+            for suffix in (API_CSV_SUFFIX, API_TTL_CSV_SUFFIX):
+                try:
+                    text = zstd.decompress(filepath.with_suffix(suffix).read_bytes()).decode("utf-8")
+                    break
+                except FileNotFoundError:
+                    continue
+            if text is None:
+                text = filepath.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            # DART 형식이 아닌 응답 (주가 등)은 zstd 압축 JSON으로 저장됨
+            return self._get_json_data(filepath.with_suffix(".json.zst"), key)
+        except Exception as e:
+            print(f"[CSV READ ERROR] {filepath}: {e}")
             return None
 
         try:
-            # CSV 읽기
-            df = pd.read_csv(filepath, encoding="utf-8")
+            # 메타데이터(첫 줄 주석)와 행 읽기
+            f = io.StringIO(text, newline="")
+            first_line = f.readline()
+            if first_line.startswith("#"):
+                metadata = _parse_metadata(first_line)
+            else:
+                metadata = {}
+                f.seek(0)
+            rows = list(csv.DictReader(f))
 
-            # 메타데이터 읽기 (첫 줄 주석)
-            with open(filepath, "r", encoding="utf-8") as f:
-                first_line = f.readline()
-                if first_line.startswith("#"):
-                    metadata_str = first_line[1:].strip()
-                    metadata = dict(item.split("=") for item in metadata_str.split(","))
-                    status = metadata.get("status", "000")
-                else:
-                    status = "000"
+            status = metadata.get("status", "000")
+
+            # TTL 만료 확인 (ttl 없으면 영구 저장)
+            expires_at = None
+            if "ttl" in metadata:
+                fetched_at = datetime.fromisoformat(metadata["fetched_at"])
+                expires_at = fetched_at + timedelta(seconds=int(metadata["ttl"]))
+                if datetime.now() > expires_at:
+                    return None
 
             # DART API 응답 형식으로 재구성
             response = {
                 "status": status,
                 "message": "OK",
-                "list": df.to_dict(orient="records")
+                "list": rows
             }
 
+            self._cache_response(key, response, expires_at)
             return response
 
         except Exception as e:
             print(f"[CSV READ ERROR] {filepath}: {e}")
             return None
 
-    def store_api_data(self, endpoint: str, params: dict, response: dict):
-        """API 응답을 CSV로 저장
+    def store_api_data(self, endpoint: str, params: dict, response: dict, ttl_seconds: int = None):
+        """API 응답을 zstd 압축 CSV(.csv.zst, TTL 있으면 .ttl.csv.zst)로 저장
 
         Atomic write (temp → rename) 방식으로 파일 손상 방지
+
+        Args:
+            ttl_seconds: 유효 시간 (초). None이면 영구 저장
         """
         filepath = self._make_filepath(endpoint, params)
-        temp_path = filepath.with_suffix(".csv.tmp")
+        zst_path = filepath.with_suffix(API_CSV_SUFFIX if ttl_seconds is None else API_TTL_CSV_SUFFIX)
+        other_path = filepath.with_suffix(API_TTL_CSV_SUFFIX if ttl_seconds is None else API_CSV_SUFFIX)
+        temp_path = zst_path.with_name(zst_path.name + ".tmp")
+
+        # DART 형식(status/list)이 아닌 응답은 JSON 그대로 (zstd 압축) 저장
+        if "status" not in response:
+            self._store_json_data(filepath.with_suffix(".json.zst"), response, ttl_seconds)
+            with self._mem_lock:
+                self._mem_cache.pop(filepath.name, None)
+            return
 
         try:
             # API 응답에서 list 추출
             data_list = response.get("list", [])
 
-            if not data_list:
-                # 데이터 없음 - 빈 CSV 저장 (status는 메타데이터로)
-                df = pd.DataFrame()
-            else:
-                df = pd.DataFrame(data_list)
-
             # 메타데이터 (첫 줄 주석)
             status = response.get("status", "000")
             message = response.get("message", "")
-            fetched_at = datetime.now().isoformat()
+            fetched_at = _now_iso()
+
+            metadata = f"# status={status},message={message},fetched_at={fetched_at}"
+            if ttl_seconds is not None:
+                metadata += f",ttl={ttl_seconds}"
+            metadata += "\n"
+
+            # CSV 텍스트 생성 (데이터 없으면 메타데이터만 저장, status는 메타데이터로)
+            buf = io.StringIO(newline="")
+            buf.write(metadata)
+            if data_list:
+                fieldnames = list(dict.fromkeys(key for row in data_list for key in row))
+                writer = csv.DictWriter(buf, fieldnames=fieldnames, restval="")
+                writer.writeheader()
+                writer.writerows(data_list)
+
+            # Temp 파일에 압축해서 쓰기
+            temp_path.write_bytes(zstd.compress(buf.getvalue().encode("utf-8"), ZSTD_LEVEL))
+
+            # Atomic rename (압축 전 형식 / 다른 형식(영구, TTL) 파일이 남아 있으면 삭제)
+            temp_path.replace(zst_path)
+            filepath.unlink(missing_ok=True)
+            other_path.unlink(missing_ok=True)
+            self._existing.discard(filepath.name)
+            self._existing.discard(other_path.name)
+            if ttl_seconds is None:
+                self._existing.add(zst_path.name)
+
+            # 메모리 캐시 무효화 (다음 조회 시 새 파일에서 읽음)
+            with self._mem_lock:
+                self._mem_cache.pop(filepath.name, None)
+
+        except Exception as e:
+            print(f"[CSV WRITE ERROR] {filepath}: {e}")
+            # Cleanup temp file
+            if temp_path.exists():
+                temp_path.unlink()
+            raise
+
+    def _cache_response(self, key: str, response: dict, expires_at: datetime | None):
+        """읽은 응답을 메모리 캐시에 추가 (가장 오래 안 쓰인 항목부터 제거, 대량 조회 중에는 생략)"""
+        if _bulk_scan.get():
+            return
+        with self._mem_lock:
+            self._mem_cache[key] = (response, expires_at)
+            self._mem_cache.move_to_end(key)
+            if len(self._mem_cache) > MEM_CACHE_SIZE:
+                self._mem_cache.popitem(last=False)
+
+    @contextmanager
+    def bulk_scan(self):
+        """대량 조회 구간 (한 번씩만 읽는 응답이 메모리 캐시의 자주 쓰는 항목을 밀어내지 않도록)
+
+        이 블록 안에서 만든 asyncio 태스크도 같은 설정을 물려받습니다.
+        """
+        token = _bulk_scan.set(True)
+        try:
+            yield
+        finally:
+            _bulk_scan.reset(token)
+
+    def _get_json_data(self, filepath: Path, key: str) -> dict | None:
+        """zstd 압축 JSON으로 저장된 응답 조회 (TTL 확인 후 메모리 캐시에 추가)"""
+        if not filepath.exists():
+            return None
+
+        try:
+            stored = orjson.loads(zstd.decompress(filepath.read_bytes()))
+
+            expires_at = None
+            if stored.get("ttl") is not None:
+                expires_at = datetime.fromisoformat(stored["fetched_at"]) + timedelta(seconds=stored["ttl"])
+                if datetime.now() > expires_at:
+                    return None
 
-            metadata = f"# status={status},message={message},fetched_at={fetched_at}\n"
+            response = stored["response"]
+            self._cache_response(key, response, expires_at)
+            return response
 
-            # Temp 파일에 쓰기
-            with open(temp_path, "w", encoding="utf-8") as f:
-                f.write(metadata)
+        except Exception as e:
+            print(f"[JSON READ ERROR] {filepath}: {e}")
+            return None
 
-            # DataFrame append (header 포함)
-            df.to_csv(temp_path, mode="a", index=False, encoding="utf-8")
+    def _store_json_data(self, filepath: Path, response: dict, ttl_seconds: int = None):
+        """응답을 zstd 압축 JSON으로 저장 (Atomic write)"""
+        temp_path = filepath.with_name(filepath.name + ".tmp")
 
-            # Atomic rename
+        try:
+            temp_path.write_bytes(zstd.compress(orjson.dumps({
+                "fetched_at": _now_iso(),
+                "ttl": ttl_seconds,
+                "response": response,
+            }), ZSTD_LEVEL))
             temp_path.replace(filepath)
 
         except Exception as e:
-            print(f"[CSV WRITE ERROR] {filepath}: {e}")
-            # Cleanup temp file
+            print(f"[JSON WRITE ERROR] {filepath}: {e}")
             if temp_path.exists():
                 temp_path.unlink()
             raise
 
+    def store_api_data_many(self, endpoint: str, items: list[tuple[dict, dict]], ttl_seconds: int = None):
+        """같은 endpoint의 API 응답 여러 개를 일괄 저장
+
+        파일마다 write+rename 지연이 직렬로 쌓이지 않도록 스레드 풀에서 동시에 저장합니다.
+
+        Args:
+            items: (params, response) 튜플 리스트
+        """
+        if len(items) <= 1:
+            for params, response in items:
+                self.store_api_data(endpoint, params, response, ttl_seconds=ttl_seconds)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(STORE_WORKERS, len(items))) as executor:
+            # list()로 완료를 기다리며 첫 번째 저장 실패는 그대로 전달
+            list(executor.map(
+                lambda item: self.store_api_data(endpoint, item[0], item[1], ttl_seconds=ttl_seconds),
+                items,
+            ))
+
     def file_exists(self, endpoint: str, params: dict) -> bool:
-        """CSV 파일 존재 여부 확인 (빠른 체크)
+        """CSV 파일 존재 여부 확인 (빠른 체크, .csv.zst 또는 압축 전 형식 .csv)
 
-        파일을 읽지 않고 존재만 확인하므로 매우 빠릅니다.
+        한 번 확인된(또는 이 프로세스에서 저장한) 파일은 파일시스템 확인도 생략합니다.
+        preload_existing 후 EXISTING_SNAPSHOT_TTL 동안은 집합만으로 판단하므로 stat을 하지 않습니다.
+        TTL 있는 일시 오류 응답(020/800/900)은 없는 것으로 판단하여 대량 조회 시 다시 가져옵니다.
         """
         filepath = self._make_filepath(endpoint, params)
-        return filepath.exists()
+        zst_path = filepath.with_suffix(API_CSV_SUFFIX)
+        if zst_path.name in self._existing:
+            return True
+        if filepath.name in self._existing:
+            return not self._has_ttl(filepath)
+        if time.monotonic() < self._existing_complete_until:
+            return False
+        if zst_path.exists():
+            self._existing.add(zst_path.name)
+            return True
+        if filepath.exists():
+            self._existing.add(filepath.name)
+            return not self._has_ttl(filepath)
+        return False
+
+    def _has_ttl(self, filepath: Path) -> bool:
+        """압축 전 형식(.csv) 응답이 TTL 있는 일시 오류 응답인지 (첫 줄 메타데이터만 읽음)"""
+        try:
+            with open(filepath, "r", encoding="utf-8") as f:
+                return "ttl" in _parse_metadata(f.readline())
+        except OSError:
+            return False
+
+    def preload_existing(self):
+        """csv 디렉토리 파일명을 한 번에 읽어 존재 집합 채우기 (대량 file_exists 확인 전에 호출)
+
+        기업마다 stat 하는 대신 os.scandir 한 번으로 전체 파일 목록을 가져옵니다.
+        """
+        with os.scandir(self.csv_dir) as entries:
+            self._existing = {entry.name for entry in entries if entry.name.endswith((".csv", API_CSV_SUFFIX))}
+        self._existing_complete_until = time.monotonic() + EXISTING_SNAPSHOT_TTL
 
     def _make_filepath(self, endpoint: str, params: dict) -> Path:
-        """파라미터로부터 CSV 파일 경로 생성
+        """파라미터로부터 CSV 파일 경로 생성 (파일명은 _build_filename 캐시 사용)"""
+        extra = tuple(params[k] for k in sorted(params) if k not in FILENAME_PARAMS)
+        return self.csv_dir / _build_filename(
+            endpoint,
+            params.get("corp_code", "unknown"),
+            params.get("bsns_year", "unknown"),
+            params.get("fs_div", "unknown"),
+            params.get("reprt_code", "unknown"),
+            params.get("corp_name", ""),
+            extra,
+        )
+
+    # ==========================================
+    # 재무 지표 뷰 저장/조회
+    # ==========================================
+
+    def get_metrics(self, endpoint: str, params: dict) -> dict[str, dict[str, float]] | None:
+        """API 응답에서 미리 추출해 둔 지표 조회 (원본 CSV 파싱 생략)
 
-        파일명 형식: {year}_{endpoint}_{corp_code}_{corp_name}_{fs_div}_{reprt_code}.csv
+        Returns:
+            dict: {term: {metric: value}} (없으면 None)
         """
-        # Endpoint에서 .json 제거
-        endpoint_name = endpoint.replace(".json", "")
+        filepath = self.metrics_dir / self._make_filepath(endpoint, params).name
 
-        # 파라미터 추출
-        corp_code = params.get("corp_code", "unknown")
-        bsns_year = params.get("bsns_year", "unknown")
-        fs_div = params.get("fs_div", "unknown")
-        reprt_code = params.get("reprt_code", "unknown")
+        if not filepath.exists():
+            return None
 
-        # 회사명 추출 (있으면 추가, 없으면 생략)
-        corp_name = params.get("corp_name", "")
+        try:
+            metrics = {}
+            with open(filepath, "r", encoding="utf-8", newline="") as f:
+                for row in csv.DictReader(f):
+                    metrics.setdefault(row["term"], {})[row["metric"]] = float(row["value"])
+            return metrics
 
-        # 파일명 생성
-        if corp_name:
-            filename = f"{bsns_year}_{endpoint_name}_{corp_code}_{corp_name}_{fs_div}_{reprt_code}.csv"
-        else:
-            filename = f"{bsns_year}_{endpoint_name}_{corp_code}_{fs_div}_{reprt_code}.csv"
+        except Exception as e:
+            print(f"[CSV READ ERROR] {filepath}: {e}")
+            return None
+
+    def store_metrics(self, endpoint: str, params: dict, metrics: dict[str, dict[str, float]]):
+        """API 응답에서 추출한 지표 저장 (term, metric, value 행)
+
+        원본 응답에서 다시 만들 수 있는 파생 데이터이므로 실패해도 예외를 올리지 않음
+        """
+        filepath = self.metrics_dir / self._make_filepath(endpoint, params).name
+        temp_path = filepath.with_suffix(".csv.tmp")
+
+        try:
+            with open(temp_path, "w", encoding="utf-8", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(("term", "metric", "value"))
+                writer.writerows(
+                    (term, metric, value)
+                    for term, values in metrics.items()
+                    for metric, value in values.items()
+                )
+
+            temp_path.replace(filepath)
 
-        return self.csv_dir / filename
+        except Exception as e:
+            print(f"[CSV WRITE ERROR] {filepath}: {e}")
+            if temp_path.exists():
+                temp_path.unlink()
 
     # ==========================================
     # 분석 결과 저장/조회
@@ -162,54 +621,249 @@ class CSVStorage:
                             filter_reasons: list,
                             indicators: dict,
                             data_source: str):
-        """분석 결과를 버퍼에 추가 (100개씩 모아서 CSV 저장)"""
-
-        # 지표별 value/score 추출
-        result_row = {
-            "corp_code": corp_code,
-            "corp_name": corp_name,
-            "stock_code": stock_code,
-            "sector": sector,
-            "bsns_year": bsns_year,
-            "fs_div": fs_div,
-            "total_score": round(total_score, 2),
-            "signal": signal,
-            "filter_passed": 1 if filter_passed else 0,
-            "filter_reasons": json.dumps(filter_reasons, ensure_ascii=False),
-            "data_source": data_source,
-            "created_at": datetime.now().isoformat(),
-        }
+        """분석 결과를 버퍼에 추가 (100개씩 모아서 CSV 저장)
 
-        # 9개 지표 추가
-        for indicator_key, indicator_data in indicators.items():
-            prefix = indicator_key
-            result_row[f"{prefix}_value"] = indicator_data.get("value", 0)
-            result_row[f"{prefix}_score"] = indicator_data.get("score", 0)
-            result_row[f"{prefix}_grade"] = indicator_data.get("grade", "")
+        행은 dict 대신 파티션 컬럼 순서(RESULT_BASE_COLUMNS + 지표 컬럼)대로 채운 list로 보관합니다.
+        """
+        row = [
+            corp_code,
+            corp_name,
+            stock_code,
+            sector,
+            bsns_year,
+            fs_div,
+            round(total_score, 2),
+            signal,
+            1 if filter_passed else 0,
+            orjson.dumps(filter_reasons).decode() if filter_reasons else _EMPTY_JSON,
+            data_source,
+            _now_iso(),
+        ]
+
+        # 지표별 value/score/grade (컬럼 위치는 파티션, 지표마다 한 번만 계산)
+        if indicators:
+            layout = self._result_layout((str(bsns_year), fs_div))
+            slots = [layout.indicator_slot(key) for key in indicators]
+            row.extend([None] * (len(layout.columns) - len(row)))
+            for (value_idx, score_idx, grade_idx), data in zip(slots, indicators.values()):
+                row[value_idx] = data.get("value", 0)
+                row[score_idx] = data.get("score", 0)
+                row[grade_idx] = data.get("grade", "")
 
         # 버퍼에 추가
-        self._results_buffer.append(result_row)
+        self._results_buffer.append(row)
+        if self._years is not None:
+            self._years.add(str(bsns_year))
 
         # 100개 모이면 flush
         if len(self._results_buffer) >= 100:
             self._flush_results()
 
+    def _result_layout(self, key: tuple[str, str]) -> _ResultLayout:
+        """파티션 컬럼 순서 조회 (처음이면 기존 파티션 파일 header로 생성)"""
+        layout = self._result_layouts.get(key)
+        if layout is None:
+            header = []
+            results_path = self._results_path(*key)
+            if results_path.exists():
+                with open(results_path, "r", encoding="utf-8", newline="") as f:
+                    header = next(csv.reader(f), None) or []
+            layout = self._result_layouts[key] = _ResultLayout(header)
+        return layout
+
+    def _results_path(self, bsns_year: str, fs_div: str) -> Path:
+        """(년도, 재무제표 구분) 파티션 결과 CSV 경로"""
+        return self.results_dir / f"buffett_analysis_{bsns_year}_{fs_div}.csv"
+
+    def _results_paths(self, bsns_year: str = None, fs_div: str = None) -> list[Path]:
+        """조건에 맞는 파티션 결과 CSV 목록 (None이면 전체)"""
+        return sorted(self.results_dir.glob(f"buffett_analysis_{bsns_year or '*'}_{fs_div or '*'}.csv"))
+
+    def _results_key(self, results_path: Path) -> tuple[str, str]:
+        """파티션 결과 CSV 경로에서 (년도, 재무제표 구분) 추출"""
+        bsns_year, _, fs_div = results_path.stem[len("buffett_analysis_"):].partition("_")
+        return bsns_year, fs_div
+
     def _flush_results(self):
-        """버퍼에 쌓인 결과를 CSV에 일괄 저장"""
+        """버퍼에 쌓인 결과를 파티션별 CSV에 일괄 저장 (열어 둔 append 핸들 사용)"""
         if not self._results_buffer:
             return
 
-        results_path = self.results_dir / "buffett_analysis.csv"
-        df = pd.DataFrame(self._results_buffer)
+        # (년도, 재무제표 구분) 파티션별로 묶기
+        partitions: dict[tuple[str, str], list[list]] = {}
+        for row in self._results_buffer:
+            partitions.setdefault((str(row[_YEAR_IDX]), row[_DIV_IDX]), []).append(row)
+
+        # 파티션마다 행을 해당 파티션 컬럼 수에 맞춤
+        for key, rows in partitions.items():
+            width = len(self._result_layout(key).columns)
+            for row in rows:
+                if len(row) < width:
+                    row.extend([None] * (width - len(row)))
+
+        for key, rows in partitions.items():
+            results_path = self._results_path(*key)
+
+            try:
+                fh, writer = self._get_results_writer(key)
+                writer.writerows(rows)
+                fh.flush()
+
+            except Exception as e:
+                print(f"[CSV WRITE ERROR] {results_path}: {e}")
+                self._close_results_writers(key)
+                raise
+
+        # Parquet 미러에도 저장 (실패하면 CSV 기준으로 파티션 재생성)
+        for key, rows in partitions.items():
+            if key in self._parquet_stale:
+                continue
+            schema = _result_schema(self._result_layouts[key].columns)
+            try:
+                self._parquet.append(pa.Table.from_arrays(
+                    [pa.array(values, type=field.type) for values, field in zip(zip(*rows), schema)],
+                    schema=schema,
+                ))
+            except Exception as e:
+                print(f"[PARQUET WRITE ERROR] {self._parquet.dataset_dir} {key}: {e}")
+                self._rebuild_parquet_partition(key)
+
+        print(f"[CSV] Flushed {len(self._results_buffer)} results to {len(partitions)} partition(s)")
+        self._results_buffer.clear()
 
-        # 파일이 없으면 header 포함, 있으면 append
-        if not results_path.exists():
-            df.to_csv(results_path, index=False, encoding="utf-8")
-        else:
-            df.to_csv(results_path, mode="a", header=False, index=False, encoding="utf-8")
+    def _get_results_writer(self, key: tuple[str, str]) -> tuple[Any, Any]:
+        """파티션 append 핸들 조회 (없거나 컬럼이 늘었으면 다시 열고, 최대 개수 넘으면 가장 오래 안 쓰인 핸들 닫기)"""
+        columns = self._result_layout(key).columns
+
+        entry = self._results_writers.get(key)
+        if entry is not None:
+            if entry[2] == len(columns):
+                self._results_writers.move_to_end(key)
+                return entry[0], entry[1]
+            self._close_results_writers(key)
+
+        results_path = self._results_path(*key)
+        header = None
+        if results_path.exists():
+            with open(results_path, "r", encoding="utf-8", newline="") as f:
+                header = next(csv.reader(f), None)
+
+        # 기존 header가 이 파티션 컬럼 순서와 다르면 파일을 현재 순서로 재작성
+        if header and header != columns:
+            self._rewrite_results_file(results_path, columns)
+
+        fh = open(results_path, "a", encoding="utf-8", newline="", buffering=RESULT_WRITE_BUFFER)
+        writer = csv.writer(fh)
+        if not header:
+            writer.writerow(columns)
+
+        self._results_writers[key] = (fh, writer, len(columns))
+        if len(self._results_writers) > RESULT_WRITERS_MAX:
+            self._close_results_writers(next(iter(self._results_writers)))
+
+        return fh, writer
+
+    def _rewrite_results_file(self, results_path: Path, columns: list[str]):
+        """파티션 파일을 주어진 컬럼 순서로 다시 기록 (Atomic rename)"""
+        temp_path = results_path.with_suffix(".csv.tmp")
+        with open(results_path, "r", encoding="utf-8", newline="") as src, \
+                open(temp_path, "w", encoding="utf-8", newline="") as dst:
+            writer = csv.writer(dst)
+            writer.writerow(columns)
+            writer.writerows([row.get(col) for col in columns] for row in csv.DictReader(src))
+        temp_path.replace(results_path)
+
+    def _close_results_writers(self, key: tuple[str, str] = None, sync: bool = False):
+        """파티션 append 핸들 닫기 (key가 None이면 전체, sync=True면 디스크까지 fsync)"""
+        keys = list(self._results_writers) if key is None else [key]
+        for k in keys:
+            entry = self._results_writers.pop(k, None)
+            if entry is None:
+                continue
+            fh = entry[0]
+            try:
+                fh.flush()
+                if sync:
+                    os.fsync(fh.fileno())
+            finally:
+                fh.close()
+
+    def close(self):
+        """남은 결과 버퍼를 저장하고 파일 핸들 닫기 (프로세스 종료 시)"""
+        self._flush_results()
+        self._close_results_writers(sync=True)
 
-        print(f"[CSV] Flushed {len(self._results_buffer)} results to {results_path}")
-        self._results_buffer.clear()
+    def _split_legacy_results(self):
+        """단일 buffett_analysis.csv (이전 형식)를 파티션별 CSV로 1회 분리"""
+        legacy_path = self.results_dir / "buffett_analysis.csv"
+
+        if not legacy_path.exists():
+            return
+
+        try:
+            with open(legacy_path, "r", encoding="utf-8", newline="") as f:
+                reader = csv.DictReader(f)
+                fieldnames = reader.fieldnames or []
+                partitions: dict[tuple[str, str], list[dict]] = {}
+                for row in reader:
+                    partitions.setdefault((row["bsns_year"], row["fs_div"]), []).append(row)
+
+            for key, rows in partitions.items():
+                results_path = self._results_path(*key)
+                temp_path = results_path.with_suffix(".csv.tmp")
+                with open(temp_path, "w", encoding="utf-8", newline="") as f:
+                    writer = csv.DictWriter(f, fieldnames=fieldnames, restval="")
+                    writer.writeheader()
+                    writer.writerows(rows)
+                temp_path.replace(results_path)
+
+            legacy_path.unlink()
+            print(f"[CSV] Split {legacy_path} into {len(partitions)} partition file(s)")
+
+        except Exception as e:
+            print(f"[CSV SPLIT ERROR] {legacy_path}: {e}")
+
+    def _backfill_parquet(self):
+        """Parquet 파티션이 없거나 행 수가 CSV와 다르면 CSV 기준으로 다시 생성 (시작 시)"""
+        for results_path in self._results_paths():
+            key = self._results_key(results_path)
+            try:
+                if self._parquet.has_partition(*key):
+                    csv_rows = pacsv.read_csv(results_path, convert_options=RESULT_COUNT_OPTIONS).num_rows
+                    if self._parquet.count(*key) == csv_rows:
+                        continue
+            except Exception as e:
+                print(f"[PARQUET CHECK ERROR] {results_path}: {e}")
+
+            if self._rebuild_parquet_partition(key):
+                print(f"[PARQUET] Backfilled {key} from {results_path}")
+
+    def _rebuild_parquet_partition(self, key: tuple[str, str]) -> bool:
+        """Parquet 파티션을 CSV로 다시 생성 (실패하면 파티션을 지우고 CSV로만 조회)
+
+        파티션을 지워 두므로 다음 시작 때 _backfill_parquet에서 다시 시도합니다.
+        """
+        results_path = self._results_path(*key)
+        try:
+            self._parquet.clear(*key)
+            if results_path.exists():
+                table = self._read_results_table(results_path)
+                self._parquet.append(table.cast(_result_schema(table.column_names)))
+            self._parquet_stale.discard(key)
+            return True
+
+        except Exception as e:
+            print(f"[PARQUET REBUILD ERROR] {results_path}: {e}")
+            self._parquet_stale.add(key)
+            try:
+                self._parquet.clear(*key)
+            except Exception as clear_error:
+                print(f"[PARQUET CLEAR ERROR] {self._parquet.dataset_dir}: {clear_error}")
+            return False
+
+    def _use_parquet(self, bsns_year: str, fs_div: str) -> bool:
+        """파티션 조회에 Parquet 미러를 쓸 수 있는지 (CSV와 맞지 않는 파티션은 CSV로 조회)"""
+        return (bsns_year, fs_div) not in self._parquet_stale and self._parquet.has_partition(bsns_year, fs_div)
 
     def get_analysis_results(self, bsns_year: str, fs_div: str) -> list[dict]:
         """분석 결과 조회 (년도 + 재무제표 구분)
@@ -220,32 +874,77 @@ class CSVStorage:
         # 버퍼 flush (저장 안된 결과가 있을 수 있음)
         self._flush_results()
 
-        results_path = self.results_dir / "buffett_analysis.csv"
+        # Parquet 미러가 있으면 해당 파티션만 읽음
+        if self._use_parquet(bsns_year, fs_div):
+            try:
+                return _decode_filter_reasons(self._parquet.read(bsns_year, fs_div))
+            except Exception as e:
+                print(f"[PARQUET READ ERROR] {self._parquet.dataset_dir}: {e}")
+
+        results_path = self._results_path(bsns_year, fs_div)
 
         if not results_path.exists():
             return []
 
         try:
-            df = pd.read_csv(results_path, encoding="utf-8")
+            # 점수 내림차순 정렬
+            table = self._read_results_table(results_path)
+            table = table.sort_by([("total_score", "descending")])
 
-            # 필터링
-            df_filtered = df[(df["bsns_year"] == bsns_year) & (df["fs_div"] == fs_div)]
+            # filter_reasons를 JSON에서 list로 파싱
+            return _decode_filter_reasons(table.to_pylist())
 
-            # 점수 내림차순 정렬
-            df_filtered = df_filtered.sort_values("total_score", ascending=False)
+        except Exception as e:
+            print(f"[CSV READ ERROR] {results_path}: {e}")
+            return []
 
-            # dict 리스트로 변환
-            results = df_filtered.to_dict(orient="records")
+    def _read_results_table(self, results_path: Path) -> pa.Table:
+        """파티션 결과 CSV를 Arrow 테이블로 읽기 (멀티스레드 CSV 파서)"""
+        return pacsv.read_csv(results_path, convert_options=RESULT_CONVERT_OPTIONS)
 
-            # filter_reasons를 JSON에서 list로 파싱
-            for result in results:
-                if isinstance(result.get("filter_reasons"), str):
-                    try:
-                        result["filter_reasons"] = json.loads(result["filter_reasons"])
-                    except:
-                        result["filter_reasons"] = []
+    def get_analysis_summary(
+        self,
+        bsns_year: str,
+        fs_div: str,
+        top_k: int = 50,
+        columns: tuple[str, ...] = ("corp_name", "total_score", "signal"),
+        passed_only: bool = False,
+    ) -> list[dict]:
+        """분석 결과 상위 top_k개를 필요한 컬럼만 조회 (filter_reasons 디코딩 없음)
+
+        Args:
+            bsns_year: 사업연도
+            fs_div: 재무제표 구분
+            top_k: 점수 상위 몇 개를 반환할지
+            columns: 반환할 컬럼
+            passed_only: 필터 통과 기업만 조회
+
+        Returns:
+            점수 내림차순 dict 리스트
+        """
+        self._flush_results()
+        columns = list(columns)
+
+        if self._use_parquet(bsns_year, fs_div):
+            try:
+                return self._parquet.read(
+                    bsns_year, fs_div, columns=columns, passed_only=passed_only, limit=top_k
+                )
+            except Exception as e:
+                print(f"[PARQUET READ ERROR] {self._parquet.dataset_dir}: {e}")
 
-            return results
+        results_path = self._results_path(bsns_year, fs_div)
+
+        if not results_path.exists():
+            return []
+
+        try:
+            table = self._read_results_table(results_path)
+            if passed_only:
+                table = table.filter(pc.equal(table["filter_passed"], 1))
+
+            top = table.sort_by([("total_score", "descending")]).slice(0, top_k)
+            return [{col: row.get(col) for col in columns} for row in top.to_pylist()]
 
         except Exception as e:
             print(f"[CSV READ ERROR] {results_path}: {e}")
@@ -253,65 +952,63 @@ class CSVStorage:
 
     def get_buffett_analysis_count(self, bsns_year: str, fs_div: str) -> int:
         """분석 결과 개수 조회"""
+        self._flush_results()
+
+        # Parquet 미러가 있으면 파일 메타데이터로 개수만 계산
+        if self._use_parquet(bsns_year, fs_div):
+            try:
+                return self._parquet.count(bsns_year, fs_div)
+            except Exception as e:
+                print(f"[PARQUET READ ERROR] {self._parquet.dataset_dir}: {e}")
+
         results = self.get_analysis_results(bsns_year, fs_div)
         return len(results)
 
     def clear_analysis_results(self, bsns_year: str = None, fs_div: str = None):
-        """분석 결과 삭제
+        """분석 결과 삭제 (해당 파티션 파일 삭제)
 
         Args:
             bsns_year: 삭제할 년도 (None이면 전체)
             fs_div: 삭제할 재무제표 구분 (None이면 전체)
         """
-        # 버퍼도 clear
+        # 버퍼, 년도 집합도 clear (파일을 삭제하므로 append 핸들도 닫음)
         self._results_buffer.clear()
+        self._years = None
+        self._close_results_writers()
+        self._parquet_stale = {
+            key for key in self._parquet_stale
+            if (bsns_year and key[0] != bsns_year) or (fs_div and key[1] != fs_div)
+        }
+        self._result_layouts = {
+            key: layout for key, layout in self._result_layouts.items()
+            if (bsns_year and key[0] != bsns_year) or (fs_div and key[1] != fs_div)
+        }
 
-        results_path = self.results_dir / "buffett_analysis.csv"
-
-        if not results_path.exists():
-            return
-
-        # 전체 삭제
-        if bsns_year is None and fs_div is None:
-            results_path.unlink()
-            print(f"[CSV] Deleted all results")
-            return
-
+        # Parquet 미러 파티션 삭제
         try:
-            df = pd.read_csv(results_path, encoding="utf-8")
-
-            # 필터링 (삭제할 행 제외)
-            if bsns_year and fs_div:
-                df = df[~((df["bsns_year"] == bsns_year) & (df["fs_div"] == fs_div))]
-            elif bsns_year:
-                df = df[df["bsns_year"] != bsns_year]
-            elif fs_div:
-                df = df[df["fs_div"] != fs_div]
+            self._parquet.clear(bsns_year, fs_div)
+        except Exception as e:
+            print(f"[PARQUET CLEAR ERROR] {self._parquet.dataset_dir}: {e}")
 
-            # 다시 저장
-            df.to_csv(results_path, index=False, encoding="utf-8")
-            print(f"[CSV] Cleared results for year={bsns_year}, fs_div={fs_div}")
+        for results_path in self._results_paths(bsns_year, fs_div):
+            try:
+                results_path.unlink()
+            except Exception as e:
+                print(f"[CSV CLEAR ERROR] {results_path}: {e}")
 
-        except Exception as e:
-            print(f"[CSV CLEAR ERROR] {results_path}: {e}")
+        print(f"[CSV] Cleared results for year={bsns_year}, fs_div={fs_div}")
 
     def get_available_years(self) -> list[str]:
-        """저장된 분석 결과의 년도 목록 조회"""
-        self._flush_results()
-
-        results_path = self.results_dir / "buffett_analysis.csv"
+        """저장된 분석 결과의 년도 목록 조회 (메모리의 년도 집합 사용)"""
+        if self._years is None:
+            self._years = self._load_years()
+        return sorted(self._years, reverse=True)
 
-        if not results_path.exists():
-            return []
+    def _load_years(self) -> set[str]:
+        """파티션 결과 CSV 파일명에서 년도 집합 계산"""
+        self._flush_results()
 
-        try:
-            df = pd.read_csv(results_path, encoding="utf-8")
-            years = df["bsns_year"].unique().tolist()
-            years.sort(reverse=True)
-            return years
-        except Exception as e:
-            print(f"[CSV READ ERROR] {results_path}: {e}")
-            return []
+        return {self._results_key(path)[0] for path in self._results_paths()}
 
 
 # 싱글톤 인스턴스
@@ -0,0 +1,128 @@
+"""Parquet 기반 분석 결과 저장소 (buffett_analysis_{year}_{fs_div}.csv 미러)
+
+bsns_year/fs_div 로 파티셔닝된 Parquet 데이터셋에 분석 결과를 저장합니다.
+조회 시 해당 파티션, 필요한 컬럼만 읽으므로 전체 CSV를 파싱하지 않습니다.
+
+    results/buffett_analysis/bsns_year=2023/fs_div=CFS/part-....parquet
+"""
+
+import shutil
+import uuid
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+# 파티션 컬럼은 문자열로 고정 ("2023"이 int로 추론되지 않도록)
+PARTITIONING = ds.partitioning(
+    pa.schema([("bsns_year", pa.string()), ("fs_div", pa.string())]),
+    flavor="hive",
+)
+
+
+class ParquetStore:
+    """파티셔닝된 Parquet 분석 결과 저장소"""
+
+    def __init__(self, dataset_dir: Path):
+        self.dataset_dir = dataset_dir
+
+    def exists(self) -> bool:
+        """데이터셋 생성 여부"""
+        return self.dataset_dir.exists()
+
+    def has_partition(self, bsns_year: str, fs_div: str) -> bool:
+        """파티션 디렉토리 존재 여부"""
+        return (self.dataset_dir / f"bsns_year={bsns_year}" / f"fs_div={fs_div}").is_dir()
+
+    def append(self, table: pa.Table):
+        """분석 결과 테이블 추가 (파티션별 새 파일로 기록)"""
+        if table.num_rows == 0:
+            return
+
+        ds.write_dataset(
+            table,
+            self.dataset_dir,
+            format="parquet",
+            partitioning=PARTITIONING,
+            basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore",
+            file_options=ds.ParquetFileFormat().make_write_options(compression="zstd"),
+        )
+
+    def count(self, bsns_year: str, fs_div: str) -> int:
+        """파티션 행 수 (파일 메타데이터만 읽음)"""
+        if not self.exists():
+            return 0
+        return self._dataset().count_rows(filter=self._partition_filter(bsns_year, fs_div))
+
+    def read(
+        self,
+        bsns_year: str,
+        fs_div: str,
+        columns: list[str] | None = None,
+        passed_only: bool = False,
+        limit: int | None = None,
+    ) -> list[dict]:
+        """파티션 조회 (점수 내림차순 정렬)
+
+        Args:
+            columns: 읽을 컬럼 (None이면 전체)
+            passed_only: filter_passed가 True인 행만 조회
+            limit: 상위 몇 개 행만 반환할지 (None이면 전체)
+        """
+        if not self.exists():
+            return []
+
+        partition = self._partition_filter(bsns_year, fs_div)
+        dataset = self._dataset(partition)
+
+        condition = partition
+        if passed_only:
+            condition = condition & (pc.field("filter_passed") == 1)
+
+        # 정렬 기준 컬럼은 프로젝션에 없어도 읽은 뒤 마지막에 제거
+        read_columns = columns
+        if columns is not None and "total_score" not in columns:
+            read_columns = list(columns) + ["total_score"]
+
+        table = dataset.to_table(columns=read_columns, filter=condition)
+        if "total_score" in table.column_names:
+            table = table.sort_by([("total_score", "descending")])
+        if limit is not None:
+            table = table.slice(0, limit)
+        if read_columns is not columns:
+            table = table.select(list(columns))
+        return table.to_pylist()
+
+    def clear(self, bsns_year: str = None, fs_div: str = None):
+        """파티션 삭제 (둘 다 None이면 전체)"""
+        if not self.exists():
+            return
+
+        if bsns_year is None and fs_div is None:
+            shutil.rmtree(self.dataset_dir)
+            return
+
+        year_glob = f"bsns_year={bsns_year}" if bsns_year else "bsns_year=*"
+        div_glob = f"fs_div={fs_div}" if fs_div else "fs_div=*"
+        for partition_dir in self.dataset_dir.glob(f"{year_glob}/{div_glob}"):
+            shutil.rmtree(partition_dir)
+
+    def _dataset(self, partition: pc.Expression = None) -> ds.Dataset:
+        """데이터셋 열기 (조회 대상 파일들의 스키마를 합쳐서 누락 컬럼은 null 처리)"""
+        dataset = ds.dataset(self.dataset_dir, format="parquet", partitioning=PARTITIONING)
+        if partition is None:
+            return dataset
+
+        schemas = [fragment.physical_schema for fragment in dataset.get_fragments(filter=partition)]
+        if not schemas:
+            return dataset
+
+        # 파일마다 int/double, null 타입이 섞일 수 있으므로 상위 타입으로 승격
+        schema = pa.unify_schemas(schemas + [PARTITIONING.schema], promote_options="permissive")
+        return ds.dataset(self.dataset_dir, schema=schema, format="parquet", partitioning=PARTITIONING)
+
+    @staticmethod
+    def _partition_filter(bsns_year: str, fs_div: str) -> pc.Expression:
+        return (pc.field("bsns_year") == bsns_year) & (pc.field("fs_div") == fs_div)
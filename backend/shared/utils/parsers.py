@@ -3,6 +3,23 @@
 from datetime import datetime
 import re
 
+# 숫자 문자열에서 제거할 문자 (쉼표, 공백) - str.translate 한 번으로 처리
+_NUM_STRIP = str.maketrans("", "", ", \t\r\n")
+_FLOAT_STRIP = str.maketrans("", "", ", \t\r\n%")
+
+# 값 없음으로 취급하는 문자열 (공백 제거 후)
+_EMPTY_SENTINELS = frozenset(("", "-", "－"))
+
+# 날짜 형식 (2024-01-01 / 2024년 01월 01일 / 20240101) - 구분자가 섞이지 않도록 형식별로 따로 매칭
+# (월/일은 strptime의 %m/%d와 같은 패턴이라 "2024131" 같은 붙여쓰기도 같게 해석)
+_MONTH = r"(1[0-2]|0[1-9]|[1-9])"
+_DAY = r"(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])"
+_DATE_RES = (
+    re.compile(rf"(\d{{4}})-{_MONTH}-{_DAY}"),
+    re.compile(rf"(\d{{4}})년\s+{_MONTH}월\s+{_DAY}일"),
+    re.compile(rf"(\d{{4}}){_MONTH}{_DAY}"),
+)
+
 
 def parse_amount(value: str | None) -> float:
     """금액 문자열을 float로 변환
@@ -11,11 +28,13 @@ def parse_amount(value: str | None) -> float:
         "-1,234,567" -> -1234567.0
         "" or "-" -> 0.0
     """
-    if not value or value.strip() in ("", "-", "－"):
+    if not value:
         return 0.0
 
     # 쉼표 제거 및 공백 제거
-    cleaned = value.replace(",", "").replace(" ", "").strip()
+    cleaned = value.translate(_NUM_STRIP)
+    if cleaned in _EMPTY_SENTINELS:
+        return 0.0
 
     try:
         return float(cleaned)
@@ -25,10 +44,12 @@ def parse_amount(value: str | None) -> float:
 
 def parse_int(value: str | None) -> int:
     """정수 문자열을 int로 변환"""
-    if not value or value.strip() in ("", "-", "－"):
+    if not value:
         return 0
 
-    cleaned = value.replace(",", "").replace(" ", "").strip()
+    cleaned = value.translate(_NUM_STRIP)
+    if cleaned in _EMPTY_SENTINELS:
+        return 0
 
     try:
         return int(float(cleaned))
@@ -38,10 +59,12 @@ def parse_int(value: str | None) -> int:
 
 def parse_float(value: str | None) -> float:
     """실수 문자열을 float로 변환"""
-    if not value or value.strip() in ("", "-", "－"):
+    if not value:
         return 0.0
 
-    cleaned = value.replace(",", "").replace(" ", "").replace("%", "").strip()
+    cleaned = value.translate(_FLOAT_STRIP)
+    if cleaned in _EMPTY_SENTINELS:
+        return 0.0
 
     try:
         return float(cleaned)
@@ -60,18 +83,22 @@ def parse_date(value: str | None) -> datetime | None:
     if not value or value.strip() in ("", "-"):
         return None
 
-    formats = [
-        "%Y-%m-%d",
-        "%Y년 %m월 %d일",
-        "%Y%m%d",
-    ]
-
     cleaned = value.strip()
 
-    for fmt in formats:
+    # YYYY-MM-DD (가장 흔한 경우)는 C 구현 fromisoformat으로 바로 변환 (ISO 주 날짜 등은 제외)
+    if (len(cleaned) == 10 and cleaned[4] == "-" and cleaned[7] == "-"
+            and cleaned[5:7].isdigit() and cleaned[8:].isdigit()):
         try:
-            return datetime.strptime(cleaned, fmt)
+            return datetime.fromisoformat(cleaned)
         except ValueError:
-            continue
+            pass
+
+    try:
+        for date_re in _DATE_RES:
+            match = date_re.fullmatch(cleaned)
+            if match is not None:
+                return datetime(int(match[1]), int(match[2]), int(match[3]))
+        return None
 
-    return None
+    except ValueError:
+        return None